@@ -11,11 +11,214 @@ try:
 except ImportError:
     SOUNDDEVICE_AVAILABLE = False
     sd = None
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 import logging
-from typing import Optional, Dict, Any, Callable
+import queue
+import sys
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, List, NamedTuple, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Preferred host APIs, best first, when the same device is exposed through several of them
+if sys.platform == "win32":
+    HOSTAPI_PREFERENCE = ("Windows WASAPI", "Windows WDM-KS", "Windows DirectSound", "MME")
+elif sys.platform == "darwin":
+    HOSTAPI_PREFERENCE = ("Core Audio",)
+else:
+    HOSTAPI_PREFERENCE = ("ALSA", "JACK Audio Connection Kit", "PulseAudio")
+
+# MME truncates device names to this many characters
+MME_NAME_LENGTH = 31
+
+# Device tests need both sounddevice and numpy
+AUDIO_TESTING_AVAILABLE = SOUNDDEVICE_AVAILABLE and NUMPY_AVAILABLE
+
+# Input test parameters
+INPUT_TEST_DURATION = 2.0  # seconds
+INPUT_TEST_SAMPLERATE = 44100
+INPUT_TEST_THRESHOLD = 0.01  # Peak level that counts as detected audio
+INPUT_LEVEL_QUEUE_SIZE = 64  # Peak levels kept for the meter; newer blocks are dropped when full
+
+# Sample rate dropdown options as (label, Hz)
+SAMPLE_RATES = (
+    ("48000 Hz (Recommended)", 48000),
+    ("44100 Hz", 44100),
+    ("32000 Hz", 32000),
+    ("16000 Hz", 16000),
+)
+_SAMPLE_RATE_LABELS = [label for label, _ in SAMPLE_RATES]
+_RATE_LABEL_BY_HZ = {hz: label for label, hz in SAMPLE_RATES}
+_RATE_HZ_BY_LABEL = {label: hz for label, hz in SAMPLE_RATES}
+
+# Fixed dialog size
+DIALOG_WIDTH = 500
+DIALOG_HEIGHT = 430
+
+# Placeholder shown in the device dropdowns while enumeration runs in the background
+LOADING_DEVICES_TEXT = "Loading devices…"
+
+
+class AudioDevice(NamedTuple):
+    """An audio device as reported by PortAudio."""
+    index: int
+    name: str
+    hostapi: int
+    max_input_channels: int
+    max_output_channels: int
+    default_samplerate: float
+
+
+class AudioDeviceRegistry:
+    """
+    Process-wide registry of available audio devices.
+    Enumerates devices once and shares the result between dialog instances,
+    since sd.query_devices() is slow on WASAPI.
+    
+    PortAudio keeps the device list it built when it was initialized, so
+    re-enumerating only picks up plugged or unplugged devices once PortAudio
+    has been re-initialized; refresh(force=True) does that.
+    """
+    
+    _lock = threading.Lock()
+    _input_devices: Optional[List[AudioDevice]] = None
+    _output_devices: Optional[List[AudioDevice]] = None
+    _alternatives: Dict[str, list] = {}
+    
+    @classmethod
+    def snapshot(cls) -> Tuple[List[AudioDevice], List[AudioDevice], Dict[str, list]]:
+        """Get the input devices, output devices and alternatives of one enumeration."""
+        with cls._lock:
+            if cls._input_devices is None:
+                cls._enumerate()
+            return list(cls._input_devices), list(cls._output_devices), dict(cls._alternatives)
+            
+    @classmethod
+    def inputs(cls) -> List[AudioDevice]:
+        """Get the available input devices."""
+        return cls.snapshot()[0]
+            
+    @classmethod
+    def outputs(cls) -> List[AudioDevice]:
+        """Get the available output devices."""
+        return cls.snapshot()[1]
+            
+    @classmethod
+    def alternatives(cls) -> Dict[str, list]:
+        """Get the devices exposed through several host APIs, keyed by the kept device's name."""
+        return cls.snapshot()[2]
+            
+    @classmethod
+    def invalidate(cls):
+        """Forget the enumerated devices so the next access enumerates them again."""
+        with cls._lock:
+            cls._input_devices = None
+            cls._output_devices = None
+            cls._alternatives = {}
+            
+    @classmethod
+    def refresh(cls, force: bool = False):
+        """
+        Enumerate devices if they have not been enumerated yet, or always if force is set.
+        
+        A forced refresh re-initializes PortAudio so that newly plugged or removed
+        devices are seen. That closes every open stream, so only force it while no
+        audio stream is running.
+        """
+        with cls._lock:
+            if force and SOUNDDEVICE_AVAILABLE:
+                sd._terminate()
+                sd._initialize()
+            if force or cls._input_devices is None:
+                cls._enumerate()
+                
+    @classmethod
+    def _enumerate(cls):
+        """Query PortAudio for the devices. The caller holds _lock."""
+        if not SOUNDDEVICE_AVAILABLE:
+            logger.warning("Sounddevice not available, using default devices")
+            cls._input_devices = [AudioDevice(0, 'Default Input', 0, 1, 0, 44100)]
+            cls._output_devices = [AudioDevice(0, 'Default Output', 0, 0, 1, 44100)]
+            cls._alternatives = {}
+            return
+            
+        devices = sd.query_devices()
+        
+        input_devices = []
+        output_devices = []
+        
+        # Populate device lists
+        for i, device in enumerate(devices):
+            device_info = AudioDevice(
+                i,
+                device['name'],
+                device['hostapi'],
+                device['max_input_channels'],
+                device['max_output_channels'],
+                device['default_samplerate']
+            )
+            
+            if device['max_input_channels'] > 0:
+                input_devices.append(device_info)
+                
+            if device['max_output_channels'] > 0:
+                output_devices.append(device_info)
+                
+        # Collapse devices listed once per host API (MME, WASAPI, ...) into one entry
+        hostapi_rank = cls._rank_hostapis(sd.query_hostapis())
+        alternatives: Dict[str, list] = {}
+        cls._input_devices = cls._dedupe_devices(input_devices, hostapi_rank, alternatives)
+        cls._output_devices = cls._dedupe_devices(output_devices, hostapi_rank, alternatives)
+        cls._alternatives = alternatives
+        
+        logger.info("Found %d input devices and %d output devices", len(cls._input_devices), len(cls._output_devices))
+        
+    @staticmethod
+    def _rank_hostapis(hostapis) -> Dict[int, int]:
+        """Map host API indexes to their preference rank (lower is better)."""
+        rank = {}
+        for i, hostapi in enumerate(hostapis):
+            try:
+                rank[i] = HOSTAPI_PREFERENCE.index(hostapi['name'])
+            except ValueError:
+                rank[i] = len(HOSTAPI_PREFERENCE)
+        return rank
+        
+    @staticmethod
+    def _dedupe_devices(devices: list, hostapi_rank: Dict[int, int], alternatives: Dict[str, list]) -> list:
+        """
+        Keep only the preferred host API's entries for devices listed under several host APIs.
+        
+        Devices are grouped by name (truncated like MME does), and within a group only the
+        entries of the best-ranked host API are kept. The full group is recorded in
+        alternatives so other host APIs can still be offered.
+        """
+        groups: Dict[str, list] = {}
+        for dev in devices:
+            key = dev.name[:MME_NAME_LENGTH].strip()
+            groups.setdefault(key, []).append(dev)
+            
+        kept = []
+        for group in groups.values():
+            best = min(hostapi_rank.get(dev.hostapi, len(HOSTAPI_PREFERENCE)) for dev in group)
+            preferred = [dev for dev in group
+                         if hostapi_rank.get(dev.hostapi, len(HOSTAPI_PREFERENCE)) == best]
+            kept.extend(preferred)
+            if len(preferred) < len(group):
+                # Input and output devices may share a name, so their groups are merged
+                for name in {dev.name for dev in preferred}:
+                    alternatives.setdefault(name, []).extend(group)
+                    
+        # Keep PortAudio's device order
+        kept.sort(key=lambda dev: dev.index)
+        return kept
+
 
 class AudioSettingsDialog:
     """
@@ -23,6 +226,12 @@ class AudioSettingsDialog:
     Shows available audio devices and allows user to select preferred ones.
     """
     
+    # Generated test tones keyed by (samplerate, frequency, duration)
+    _TEST_TONE_CACHE: Dict[tuple, Any] = {}
+    
+    # Fonts shared by every dialog instance, created on first use (Tk needs a root)
+    _fonts: Optional[Dict[str, ctk.CTkFont]] = None
+    
     def __init__(self, parent: ctk.CTk, current_settings: Dict[str, Any] = None):
         self.parent = parent
         self.dialog: Optional[ctk.CTkToplevel] = None
@@ -32,6 +241,17 @@ class AudioSettingsDialog:
         self.input_devices = []
         self.output_devices = []
         
+        # Device name -> PortAudio device index for the dropdown selections
+        self._input_by_name: Dict[str, int] = {}
+        self._output_by_name: Dict[str, int] = {}
+        
+        # Dropdown values, in device order
+        self._input_names: List[str] = []
+        self._output_names: List[str] = []
+        
+        # Device name -> the same device as exposed through every host API
+        self._alternatives: Dict[str, list] = {}
+        
         # Selected devices
         self.selected_input_device = self.current_settings.get('input_device', None)
         self.selected_output_device = self.current_settings.get('output_device', None)
@@ -41,16 +261,61 @@ class AudioSettingsDialog:
         self.output_dropdown: Optional[ctk.CTkComboBox] = None
         self.test_input_button: Optional[ctk.CTkButton] = None
         self.test_output_button: Optional[ctk.CTkButton] = None
+        self.input_level_bar: Optional[ctk.CTkProgressBar] = None
+        self.save_button: Optional[ctk.CTkButton] = None
+        self._input_var: Optional[ctk.StringVar] = None
+        self._output_var: Optional[ctk.StringVar] = None
+        
+        # Running input test: stream, peak levels from the audio callback, start time,
+        # pending level meter update
+        self._input_test_stream = None
+        self._input_level_queue: "queue.Queue" = queue.Queue(maxsize=INPUT_LEVEL_QUEUE_SIZE)
+        self._input_test_peak = 0.0
+        self._input_test_started = 0.0
+        self._vu_after: Optional[str] = None
+        
+        # Device enumeration results posted by the worker thread, and the pending poll for them
+        self._result_queue: "queue.Queue" = queue.Queue()
+        self._poll_after: Optional[str] = None
         
         # Callback for when settings are saved
         self.on_settings_saved: Optional[Callable] = None
         
+    @classmethod
+    def invalidate_device_cache(cls):
+        """Forget cached device lists so the next dialog re-enumerates devices."""
+        AudioDeviceRegistry.invalidate()
+        
+    @classmethod
+    def _get_fonts(cls) -> Dict[str, ctk.CTkFont]:
+        """Get the dialog fonts, creating them the first time."""
+        if cls._fonts is None:
+            cls._fonts = {
+                'title': ctk.CTkFont(size=24, weight="bold"),
+                'section': ctk.CTkFont(size=16, weight="bold"),
+                'bold': ctk.CTkFont(weight="bold"),
+            }
+        return cls._fonts
+        
+    @property
+    def selected_input_name(self) -> str:
+        """Name currently selected in the input device dropdown."""
+        return self._input_var.get()
+        
+    @property
+    def selected_output_name(self) -> str:
+        """Name currently selected in the output device dropdown."""
+        return self._output_var.get()
+        
     def show(self):
         """Show the audio settings dialog."""
         self._create_dialog()
-        self._load_audio_devices()
         self._setup_ui()
         
+        # Enumerate devices off the Tk main thread and fill the dropdowns when done
+        threading.Thread(target=self._enumerate_worker, daemon=True).start()
+        self._poll_after = self.dialog.after(50, self._poll_devices)
+        
     def _create_dialog(self):
         """Create the dialog window."""
         self.dialog = ctk.CTkToplevel(self.parent)
@@ -62,11 +327,11 @@ class AudioSettingsDialog:
         
         # Calculate centered position first, then set geometry once
         # Use withdraw to prevent flickering during positioning
+        # (the size is fixed, so no layout pass is needed before measuring)
         self.dialog.withdraw()
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (500 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (400 // 2)
-        self.dialog.geometry(f"500x400+{x}+{y}")
+        x = (self.dialog.winfo_screenwidth() // 2) - (DIALOG_WIDTH // 2)
+        y = (self.dialog.winfo_screenheight() // 2) - (DIALOG_HEIGHT // 2)
+        self.dialog.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
         
         # Configure grid
         self.dialog.grid_columnconfigure(0, weight=1)
@@ -75,8 +340,17 @@ class AudioSettingsDialog:
         # Show the dialog after positioning is complete
         self.dialog.deiconify()
         
-        # Set grab after dialog is properly displayed
-        self.dialog.after(100, self._safe_grab_set)
+        # Set grab as soon as the dialog is mapped (grab_set needs a viewable window)
+        self.dialog.bind("<Map>", self._on_dialog_map, add="+")
+        
+        # Closing the window cancels like the Cancel button, so a running input test is stopped
+        self.dialog.protocol("WM_DELETE_WINDOW", self._cancel)
+        
+    def _on_dialog_map(self, event):
+        """Set grab once the dialog window itself is mapped."""
+        # Child widgets' <Map> events also reach the toplevel binding
+        if event.widget is self.dialog:
+            self._safe_grab_set()
         
     def _safe_grab_set(self):
         """Safely set grab on the dialog."""
@@ -84,48 +358,106 @@ class AudioSettingsDialog:
             if self.dialog and self.dialog.winfo_exists():
                 self.dialog.grab_set()
         except Exception as e:
-            logger.debug(f"Could not set grab on dialog: {e}")
+            logger.debug("Could not set grab on dialog: %s", e)
         
-    def _load_audio_devices(self):
-        """Load available audio devices."""
-        if not SOUNDDEVICE_AVAILABLE:
-            logger.warning("Sounddevice not available, using default devices")
-            self.input_devices = [{'index': 0, 'name': 'Default Input', 'hostapi': 0, 'max_input_channels': 1, 'max_output_channels': 0, 'default_samplerate': 44100}]
-            self.output_devices = [{'index': 0, 'name': 'Default Output', 'hostapi': 0, 'max_input_channels': 0, 'max_output_channels': 1, 'default_samplerate': 44100}]
+    def _enumerate_worker(self):
+        """Enumerate audio devices in a background thread."""
+        try:
+            self._load_audio_devices()
+            self._result_queue.put((self.input_devices, self.output_devices))
+        except Exception as e:
+            logger.error("Failed to load audio devices: %s", e)
+            self._result_queue.put(e)
+            
+    def _poll_devices(self):
+        """Check for enumeration results from the worker thread."""
+        self._poll_after = None
+        if not self.dialog:
             return
             
         try:
-            devices = sd.query_devices()
-            
-            # Clear device lists
-            self.input_devices = []
-            self.output_devices = []
-            
-            # Populate device lists
-            for i, device in enumerate(devices):
-                device_info = {
-                    'index': i,
-                    'name': device['name'],
-                    'hostapi': device['hostapi'],
-                    'max_input_channels': device['max_input_channels'],
-                    'max_output_channels': device['max_output_channels'],
-                    'default_samplerate': device['default_samplerate']
-                }
-                
-                if device['max_input_channels'] > 0:
-                    self.input_devices.append(device_info)
-                    
-                if device['max_output_channels'] > 0:
-                    self.output_devices.append(device_info)
-                    
-            logger.info(f"Found {len(self.input_devices)} input devices and {len(self.output_devices)} output devices")
+            result = self._result_queue.get_nowait()
+        except queue.Empty:
+            self._poll_after = self.dialog.after(50, self._poll_devices)
+            return
             
-        except Exception as e:
-            logger.error(f"Failed to load audio devices: {e}")
-            messagebox.showerror("Error", f"Failed to load audio devices: {e}")
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"Failed to load audio devices: {result}")
+            self.input_devices, self.output_devices = [], []
+        else:
+            self.input_devices, self.output_devices = result
+            
+        self._populate_dropdowns()
+        
+    def _load_audio_devices(self):
+        """Load available audio devices. Runs on the enumeration worker thread."""
+        self.input_devices, self.output_devices, self._alternatives = AudioDeviceRegistry.snapshot()
+        
+    def _populate_dropdowns(self):
+        """Fill the device dropdowns with the enumerated devices."""
+        # The test buttons stay disabled without these, so say why in the log
+        if not AUDIO_TESTING_AVAILABLE:
+            logger.warning("Audio testing is not available because sounddevice or numpy is not installed "
+                           "(pip install sounddevice numpy)")
+            
+        self._input_by_name = self._index_by_name(self.input_devices)
+        self._output_by_name = self._index_by_name(self.output_devices)
+        self._input_names = list(self._input_by_name)
+        self._output_names = list(self._output_by_name)
+        
+        self._populate_device_dropdown(
+            self.input_dropdown, self.test_input_button, self._input_names,
+            self._input_by_name, self.selected_input_device, "No input devices found"
+        )
+        self._populate_device_dropdown(
+            self.output_dropdown, self.test_output_button, self._output_names,
+            self._output_by_name, self.selected_output_device, "No output devices found"
+        )
+        
+        # Saving before the dropdowns are filled would drop the configured devices
+        self.save_button.configure(state="normal")
+        
+    @staticmethod
+    def _index_by_name(devices: List[AudioDevice]) -> Dict[str, int]:
+        """Map device names to device indexes, keeping the first device for duplicate names."""
+        by_name: Dict[str, int] = {}
+        for dev in devices:
+            by_name.setdefault(dev.name, dev.index)
+        return by_name
+        
+    def _populate_device_dropdown(self, dropdown: ctk.CTkComboBox, test_button: ctk.CTkButton,
+                                  device_names: List[str], devices_by_name: Dict[str, int],
+                                  selected_device: Optional[int], empty_text: str):
+        """Swap the dropdown values for the given devices and restore the selection."""
+        if not device_names:
+            dropdown.configure(values=[empty_text], state="disabled")
+            dropdown.set(empty_text)
+            test_button.configure(state="disabled")
+            return
+            
+        dropdown.configure(values=device_names, state="readonly")
+        dropdown.set(device_names[0])
+        
+        # Set current selection
+        if selected_device is not None:
+            # device_names follows devices_by_name's order, so positions line up
+            try:
+                position = tuple(devices_by_name.values()).index(selected_device)
+                dropdown.set(device_names[position])
+            except ValueError:
+                # The saved device may be a duplicate the registry dropped in favour
+                # of another host API (e.g. an MME index from older settings)
+                for name, group in self._alternatives.items():
+                    if name in devices_by_name and any(dev.index == selected_device for dev in group):
+                        dropdown.set(name)
+                        break
+                
+        test_button.configure(state="normal" if AUDIO_TESTING_AVAILABLE else "disabled")
             
     def _setup_ui(self):
         """Set up the dialog UI."""
+        fonts = self._get_fonts()
+        
         # Main container
         main_frame = ctk.CTkFrame(self.dialog, corner_radius=0)
         main_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
@@ -135,7 +467,7 @@ class AudioSettingsDialog:
         title_label = ctk.CTkLabel(
             main_frame,
             text="🎵 Audio Device Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=fonts['title']
         )
         title_label.grid(row=0, column=0, pady=(20, 30))
         
@@ -147,33 +479,21 @@ class AudioSettingsDialog:
         input_label = ctk.CTkLabel(
             input_frame,
             text="🎤 Input Device:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=fonts['section']
         )
         input_label.grid(row=0, column=0, padx=15, pady=15, sticky="w")
         
-        # Input device dropdown
-        input_device_names = [f"{dev['name']}" for dev in self.input_devices]
-        if not input_device_names:
-            input_device_names = ["No input devices found"]
-            
+        # Input device dropdown (filled in by _populate_dropdowns)
+        self._input_var = ctk.StringVar(value=LOADING_DEVICES_TEXT)
         self.input_dropdown = ctk.CTkComboBox(
             input_frame,
-            values=input_device_names,
-            state="readonly" if input_device_names[0] != "No input devices found" else "disabled",
+            values=[LOADING_DEVICES_TEXT],
+            variable=self._input_var,
+            state="disabled",
             width=250
         )
         self.input_dropdown.grid(row=0, column=1, padx=(0, 15), pady=15, sticky="ew")
         
-        # Set current selection
-        if self.selected_input_device is not None:
-            try:
-                current_name = next(dev['name'] for dev in self.input_devices if dev['index'] == self.selected_input_device)
-                self.input_dropdown.set(current_name)
-            except StopIteration:
-                pass
-        elif input_device_names and input_device_names[0] != "No input devices found":
-            self.input_dropdown.set(input_device_names[0])
-            
         # Test input button
         self.test_input_button = ctk.CTkButton(
             input_frame,
@@ -181,10 +501,15 @@ class AudioSettingsDialog:
             width=80,
             command=self._test_input_device,
             corner_radius=8,
-            state="normal" if input_device_names[0] != "No input devices found" else "disabled"
+            state="disabled"
         )
         self.test_input_button.grid(row=0, column=2, padx=(0, 15), pady=15)
         
+        # Live input level meter, driven by the input test
+        self.input_level_bar = ctk.CTkProgressBar(input_frame, height=8)
+        self.input_level_bar.set(0)
+        self.input_level_bar.grid(row=1, column=0, columnspan=3, padx=15, pady=(0, 15), sticky="ew")
+        
         # Output device section
         output_frame = ctk.CTkFrame(main_frame, corner_radius=0)
         output_frame.grid(row=2, column=0, sticky="ew", padx=20, pady=(0, 20))
@@ -193,33 +518,21 @@ class AudioSettingsDialog:
         output_label = ctk.CTkLabel(
             output_frame,
             text="🔊 Output Device:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=fonts['section']
         )
         output_label.grid(row=0, column=0, padx=15, pady=15, sticky="w")
         
-        # Output device dropdown
-        output_device_names = [f"{dev['name']}" for dev in self.output_devices]
-        if not output_device_names:
-            output_device_names = ["No output devices found"]
-            
+        # Output device dropdown (filled in by _populate_dropdowns)
+        self._output_var = ctk.StringVar(value=LOADING_DEVICES_TEXT)
         self.output_dropdown = ctk.CTkComboBox(
             output_frame,
-            values=output_device_names,
-            state="readonly" if output_device_names[0] != "No output devices found" else "disabled",
+            values=[LOADING_DEVICES_TEXT],
+            variable=self._output_var,
+            state="disabled",
             width=250
         )
         self.output_dropdown.grid(row=0, column=1, padx=(0, 15), pady=15, sticky="ew")
         
-        # Set current selection
-        if self.selected_output_device is not None:
-            try:
-                current_name = next(dev['name'] for dev in self.output_devices if dev['index'] == self.selected_output_device)
-                self.output_dropdown.set(current_name)
-            except StopIteration:
-                pass
-        elif output_device_names and output_device_names[0] != "No output devices found":
-            self.output_dropdown.set(output_device_names[0])
-            
         # Test output button
         self.test_output_button = ctk.CTkButton(
             output_frame,
@@ -227,7 +540,7 @@ class AudioSettingsDialog:
             width=80,
             command=self._test_output_device,
             corner_radius=8,
-            state="normal" if output_device_names[0] != "No output devices found" else "disabled"
+            state="disabled"
         )
         self.test_output_button.grid(row=0, column=2, padx=(0, 15), pady=15)
         
@@ -239,15 +552,14 @@ class AudioSettingsDialog:
         quality_label = ctk.CTkLabel(
             quality_frame,
             text="⚙️ Audio Quality:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=fonts['section']
         )
         quality_label.grid(row=0, column=0, padx=15, pady=15, sticky="w")
         
         # Sample rate dropdown
-        sample_rates = ["48000 Hz (Recommended)", "44100 Hz", "32000 Hz", "16000 Hz"]
         self.sample_rate_dropdown = ctk.CTkComboBox(
             quality_frame,
-            values=sample_rates,
+            values=_SAMPLE_RATE_LABELS,
             state="readonly",
             width=200
         )
@@ -255,12 +567,7 @@ class AudioSettingsDialog:
         
         # Set current sample rate
         current_sample_rate = self.current_settings.get('sample_rate', 48000)
-        for rate_option in sample_rates:
-            if str(current_sample_rate) in rate_option:
-                self.sample_rate_dropdown.set(rate_option)
-                break
-        else:
-            self.sample_rate_dropdown.set(sample_rates[0])
+        self.sample_rate_dropdown.set(_RATE_LABEL_BY_HZ.get(current_sample_rate, _SAMPLE_RATE_LABELS[0]))
             
         # Buttons
         button_frame = ctk.CTkFrame(main_frame, corner_radius=0, fg_color="transparent")
@@ -279,114 +586,171 @@ class AudioSettingsDialog:
         )
         cancel_button.grid(row=0, column=0, padx=(0, 10), pady=10, sticky="e")
         
-        save_button = ctk.CTkButton(
+        # Save button (enabled by _populate_dropdowns)
+        self.save_button = ctk.CTkButton(
             button_frame,
             text="Save Settings",
             width=120,
             corner_radius=8,
             height=40,
             command=self._save_settings,
-            font=ctk.CTkFont(weight="bold")
+            font=fonts['bold'],
+            state="disabled"
         )
-        save_button.grid(row=0, column=1, padx=(10, 0), pady=10, sticky="w")
+        self.save_button.grid(row=0, column=1, padx=(10, 0), pady=10, sticky="w")
         
     def _test_input_device(self):
         """Test the selected input device."""
-        if not SOUNDDEVICE_AVAILABLE:
-            messagebox.showwarning("Audio Testing", "Audio testing is not available because sounddevice is not installed.\n\nPlease install it with: pip install sounddevice")
-            return
-            
         try:
-            selected_name = self.input_dropdown.get()
-            device_index = next(dev['index'] for dev in self.input_devices if dev['name'] == selected_name)
+            selected_name = self.selected_input_name
+            device_index = self._input_by_name[selected_name]
             
             # Test recording for 2 seconds
             messagebox.showinfo("Testing Input", f"Testing input device: {selected_name}\n\nSpeak into your microphone for 2 seconds...")
             
-            import numpy as np
-            duration = 2  # seconds
-            samplerate = 44100
+            # Record through a callback stream so the dialog stays responsive
+            self._input_level_queue = queue.Queue(maxsize=INPUT_LEVEL_QUEUE_SIZE)
+            self._input_test_peak = 0.0
+            self._input_test_stream = sd.InputStream(
+                samplerate=INPUT_TEST_SAMPLERATE,
+                channels=1,
+                device=device_index,
+                blocksize=1024,
+                callback=self._input_test_cb
+            )
+            self._input_test_stream.start()
+            self._input_test_started = time.monotonic()
             
-            # Record audio
-            recording = sd.rec(int(duration * samplerate), samplerate=samplerate, channels=1, device=device_index)
-            sd.wait()
+            self.test_input_button.configure(state="disabled")
+            self._vu_after = self.dialog.after(30, self._drain_vu)
             
-            # Check if any audio was captured
-            max_amplitude = np.max(np.abs(recording))
-            if max_amplitude > 0.01:  # Threshold for detecting audio
-                messagebox.showinfo("Test Result", f"✅ Input device working!\n\nDetected audio level: {max_amplitude:.3f}")
-            else:
-                messagebox.showwarning("Test Result", "⚠️ No audio detected.\n\nPlease check your microphone connection and try speaking louder.")
-                
         except Exception as e:
-            logger.error(f"Failed to test input device: {e}")
+            self._stop_input_test()
+            logger.error("Failed to test input device: %s", e)
             messagebox.showerror("Test Failed", f"Failed to test input device:\n{e}")
             
-    def _test_output_device(self):
-        """Test the selected output device."""
-        if not SOUNDDEVICE_AVAILABLE:
-            messagebox.showwarning("Audio Testing", "Audio testing is not available because sounddevice is not installed.\n\nPlease install it with: pip install sounddevice")
+    def _input_test_cb(self, indata, frames, time_info, status):
+        """Audio callback for the input test; posts the block's peak level."""
+        # Peak level from two reductions, without allocating an abs() copy
+        try:
+            self._input_level_queue.put_nowait(max(-float(indata.min()), float(indata.max())))
+        except queue.Full:
+            pass
+            
+    def _drain_vu(self):
+        """Update the level meter from the audio callback and finish the test when done."""
+        self._vu_after = None
+        if not self.dialog or self._input_test_stream is None:
             return
             
+        level = None
+        while True:
+            try:
+                level = self._input_level_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._input_test_peak = max(self._input_test_peak, level)
+            
+        if level is not None:
+            self.input_level_bar.set(min(level * 5, 1.0))
+            
+        if time.monotonic() - self._input_test_started < INPUT_TEST_DURATION:
+            self._vu_after = self.dialog.after(30, self._drain_vu)
+            return
+            
+        self._stop_input_test()
+        self.input_level_bar.set(0)
+        self.test_input_button.configure(state="normal")
+        
+        # Check if any audio was captured
+        max_amplitude = self._input_test_peak
+        if max_amplitude > INPUT_TEST_THRESHOLD:
+            messagebox.showinfo("Test Result", f"✅ Input device working!\n\nDetected audio level: {max_amplitude:.3f}")
+        else:
+            messagebox.showwarning("Test Result", "⚠️ No audio detected.\n\nPlease check your microphone connection and try speaking louder.")
+            
+    def _stop_input_test(self):
+        """Stop and close the input test stream if one is running."""
+        # Drop the pending level meter update, which would otherwise outlive the dialog
+        if self._vu_after is not None:
+            self.dialog.after_cancel(self._vu_after)
+            self._vu_after = None
+            
+        stream = self._input_test_stream
+        self._input_test_stream = None
+        if stream is None:
+            return
         try:
-            selected_name = self.output_dropdown.get()
-            device_index = next(dev['index'] for dev in self.output_devices if dev['name'] == selected_name)
+            stream.stop()
+            stream.close()
+        except Exception as e:
+            logger.debug("Could not close input test stream: %s", e)
+            
+    def _test_output_device(self):
+        """Test the selected output device."""
+        try:
+            selected_name = self.selected_output_name
+            device_index = self._output_by_name[selected_name]
             
             # Generate a test tone
-            import numpy as np
             duration = 2  # seconds
             samplerate = 44100
             frequency = 440  # A4 note
             
-            # Generate sine wave
-            t = np.linspace(0, duration, int(samplerate * duration), False)
-            test_tone = 0.1 * np.sin(2 * np.pi * frequency * t)
+            # Generate sine wave (float32, which is what PortAudio plays anyway)
+            key = (samplerate, frequency, duration)
+            test_tone = self._TEST_TONE_CACHE.get(key)
+            if test_tone is None:
+                t = np.arange(samplerate * duration, dtype=np.float32) * np.float32(1.0 / samplerate)
+                test_tone = np.sin(np.float32(2 * np.pi * frequency) * t)
+                test_tone *= np.float32(0.1)
+                self._TEST_TONE_CACHE[key] = test_tone
             
             messagebox.showinfo("Testing Output", f"Playing test tone on: {selected_name}\n\nYou should hear a 2-second tone.")
             
-            # Play the test tone
-            sd.play(test_tone, samplerate=samplerate, device=device_index)
-            sd.wait()
+            # Play the test tone on an explicit stream so PortAudio releases it right away
+            with sd.OutputStream(samplerate=samplerate, channels=1, device=device_index, dtype='float32') as stream:
+                stream.write(test_tone)
             
             messagebox.showinfo("Test Complete", "✅ Test tone completed!\n\nDid you hear the sound?")
             
         except Exception as e:
-            logger.error(f"Failed to test output device: {e}")
+            logger.error("Failed to test output device: %s", e)
             messagebox.showerror("Test Failed", f"Failed to test output device:\n{e}")
             
     def _save_settings(self):
         """Save the audio settings."""
         try:
             settings = {}
+            selected_input_name = self.selected_input_name
+            selected_output_name = self.selected_output_name
+            sample_rate_text = self.sample_rate_dropdown.get()
             
             # Get selected input device
-            if self.input_dropdown.get() != "No input devices found":
-                selected_input_name = self.input_dropdown.get()
-                input_device_index = next(dev['index'] for dev in self.input_devices if dev['name'] == selected_input_name)
+            if selected_input_name != "No input devices found":
+                input_device_index = self._input_by_name[selected_input_name]
                 settings['input_device'] = input_device_index
                 settings['input_device_name'] = selected_input_name
             
             # Get selected output device
-            if self.output_dropdown.get() != "No output devices found":
-                selected_output_name = self.output_dropdown.get()
-                output_device_index = next(dev['index'] for dev in self.output_devices if dev['name'] == selected_output_name)
+            if selected_output_name != "No output devices found":
+                output_device_index = self._output_by_name[selected_output_name]
                 settings['output_device'] = output_device_index
                 settings['output_device_name'] = selected_output_name
             
             # Get sample rate
-            sample_rate_text = self.sample_rate_dropdown.get()
-            sample_rate = int(sample_rate_text.split()[0])
+            sample_rate = _RATE_HZ_BY_LABEL[sample_rate_text]
             settings['sample_rate'] = sample_rate
             
             # Call the callback if set
             if self.on_settings_saved:
                 self.on_settings_saved(settings)
             
-            logger.info(f"Audio settings saved: {settings}")
+            logger.info("Audio settings saved: %s", settings)
             self._close_dialog()
             
         except Exception as e:
-            logger.error(f"Failed to save audio settings: {e}")
+            logger.error("Failed to save audio settings: %s", e)
             messagebox.showerror("Error", f"Failed to save settings:\n{e}")
             
     def _cancel(self):
@@ -395,7 +759,12 @@ class AudioSettingsDialog:
         
     def _close_dialog(self):
         """Close the dialog."""
+        self._stop_input_test()
         if self.dialog:
+            # Closed before the devices were loaded: stop polling for them
+            if self._poll_after is not None:
+                self.dialog.after_cancel(self._poll_after)
+                self._poll_after = None
             try:
                 self.dialog.grab_release()
             except Exception:
@@ -4,14 +4,23 @@ Provides a step-by-step guided interface for creating and joining chats.
 """
 
 import customtkinter as ctk
-from tkinter import messagebox
+import tkinter as tk
+import functools
 import logging
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, Callable, Deque, Dict, Any, FrozenSet, List, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """Return a CTkFont shared by all wizards; call only once a Tk root exists."""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
 class WizardStep(Enum):
     """Enumeration of wizard steps."""
     WELCOME = "welcome"
@@ -25,6 +34,182 @@ class WizardStep(Enum):
     WAITING_CONNECTION = "waiting_connection"
 
 
+class _TooltipManager:
+    """
+    Hover tooltips for any number of widgets, shown in one reusable window.
+    
+    The window is created on first use and then only withdrawn and shown again.
+    """
+    
+    SHOW_DELAY_MS = 1500  # Hover time before the tooltip appears
+    HIDE_AFTER_MS = 10000  # Hide again after 10 seconds (long enough for important info)
+    
+    def __init__(self):
+        self._texts: Dict[str, str] = {}  # Widget path -> tooltip text
+        self._tip: Optional[ctk.CTkToplevel] = None
+        self._label: Optional[ctk.CTkLabel] = None
+        self._timer_widget = None
+        self._show_after: Optional[str] = None
+        self._hide_after: Optional[str] = None
+    
+    def register(self, widget, text: str) -> None:
+        """Show text when the mouse rests on widget; re-registering only updates the text."""
+        key = str(widget)
+        if key not in self._texts:
+            widget.bind("<Enter>", functools.partial(self._on_enter, widget), add="+")
+            widget.bind("<Leave>", self.hide, add="+")
+            widget.bind("<Button-1>", self.hide, add="+")
+        self._texts[key] = text
+    
+    def hide(self, event=None) -> None:
+        """Cancel a pending tooltip and hide the visible one."""
+        self._cancel_timers()
+        if self._tip is not None and self._tip.winfo_exists():
+            self._tip.withdraw()
+    
+    def destroy(self) -> None:
+        """Cancel pending timers and destroy the tooltip window."""
+        self._cancel_timers()
+        if self._tip is not None and self._tip.winfo_exists():
+            self._tip.destroy()
+        self._tip = None
+        self._label = None
+    
+    def _on_enter(self, widget, event) -> None:
+        """Start the show delay for widget's tooltip."""
+        self.hide()
+        self._timer_widget = widget
+        self._show_after = widget.after(self.SHOW_DELAY_MS, self._show, widget, event.x_root, event.y_root)
+    
+    def _cancel_timers(self) -> None:
+        """Cancel the pending show/hide callbacks."""
+        # after_cancel also works with the ids of an already destroyed widget
+        widget = self._timer_widget
+        for after_id in (self._show_after, self._hide_after):
+            if after_id is not None and widget is not None:
+                widget.after_cancel(after_id)
+        self._show_after = None
+        self._hide_after = None
+    
+    def _ensure_window(self, widget) -> ctk.CTkToplevel:
+        """Return the tooltip window, creating it (withdrawn) if needed."""
+        if self._tip is None or not self._tip.winfo_exists():
+            # Owned by the widget so the window goes away with the wizard
+            self._tip = ctk.CTkToplevel(widget)
+            self._tip.withdraw()
+            self._tip.wm_overrideredirect(True)  # Remove window decorations
+            self._tip.wm_attributes("-topmost", True)  # Keep on top
+            
+            # Create tooltip label with better readability
+            self._label = ctk.CTkLabel(
+                self._tip,
+                text="",
+                font=_get_font(13),  # Larger, clearer font
+                text_color=("black", "white"),  # High contrast colors
+                fg_color=("white", "black"),  # High contrast background
+                corner_radius=8,
+                padx=12,  # More padding
+                pady=8,   # More padding
+                wraplength=350  # Allow text wrapping for long messages
+            )
+            self._label.pack()
+        return self._tip
+    
+    def _show(self, widget, x_root: int, y_root: int) -> None:
+        """Show widget's tooltip near the mouse position, kept on screen."""
+        self._show_after = None
+        if not widget.winfo_exists():
+            return
+        
+        tip = self._ensure_window(widget)
+        self._label.configure(text=self._texts[str(widget)])
+        
+        # Position tooltip near mouse cursor but ensure it stays on screen
+        x = x_root + 15
+        y = y_root + 15
+        tip.update_idletasks()
+        tooltip_width = tip.winfo_reqwidth()
+        tooltip_height = tip.winfo_reqheight()
+        if x + tooltip_width > tip.winfo_screenwidth():
+            x = x_root - tooltip_width - 15
+        if y + tooltip_height > tip.winfo_screenheight():
+            y = y_root - tooltip_height - 15
+        
+        tip.geometry(f"+{x}+{y}")
+        tip.deiconify()
+        tip.lift()
+        
+        self._hide_after = widget.after(self.HIDE_AFTER_MS, self.hide)
+
+
+class _ReadonlyTextbox(ctk.CTkTextbox):
+    """
+    A CTkTextbox the user can select and copy from but not edit.
+    
+    The text widget stays in the "normal" state and edits are blocked by key
+    bindings instead, so code can replace the text without toggling the state.
+    """
+    
+    # Keys that delete or insert text whatever the modifiers
+    _EDIT_KEYS = frozenset(("BackSpace", "Delete", "KP_Delete", "Return", "KP_Enter", "Insert"))
+    # Emacs-style Text bindings that edit with Control held
+    _CONTROL_EDIT_KEYS = frozenset(("d", "D", "h", "H", "i", "I", "k", "K", "o", "O", "t", "T"))
+    _CONTROL_MASK = 0x0004
+    # Alt on X11 and Windows, Command on macOS
+    _MOD1_MASK = 0x0008
+    
+    def __init__(self, *args, **kwargs):
+        kwargs["state"] = "normal"
+        super().__init__(*args, **kwargs)
+        # No blinking insert cursor in a field that cannot be typed into
+        self._textbox.configure(insertwidth=0)
+        
+        self.bind("<Key>", self._on_key)
+        # The Text class inserts a tab on Tab; move the keyboard focus on instead
+        self.bind("<Tab>", self._focus_next)
+        self.bind("<Shift-Tab>", self._focus_prev)
+        self.bind("<ISO_Left_Tab>", self._focus_prev)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>", "<<Undo>>", "<<Redo>>"):
+            self.bind(sequence, self._block)
+    
+    def _on_key(self, event) -> Optional[str]:
+        """Drop the keys that would edit the text and let everything else through."""
+        keysym = event.keysym
+        if event.state & self._CONTROL_MASK:
+            # Control-Insert copies
+            if keysym in self._CONTROL_EDIT_KEYS or (keysym in self._EDIT_KEYS and keysym != "Insert"):
+                return "break"
+            return None
+        if keysym in self._EDIT_KEYS:
+            return "break"
+        if event.state & self._MOD1_MASK:
+            # Meta-d deletes a word; other Alt/Command keys are shortcuts such as Cmd+C
+            return "break" if keysym in ("d", "D") else None
+        # Typed characters
+        if event.char and event.char.isprintable():
+            return "break"
+        return None
+    
+    def _focus_next(self, event=None) -> str:
+        """Move the keyboard focus to the next widget."""
+        widget = self._textbox.tk_focusNext()
+        if widget is not None:
+            widget.focus_set()
+        return "break"
+    
+    def _focus_prev(self, event=None) -> str:
+        """Move the keyboard focus to the previous widget."""
+        widget = self._textbox.tk_focusPrev()
+        if widget is not None:
+            widget.focus_set()
+        return "break"
+    
+    @staticmethod
+    def _block(event=None) -> str:
+        """Stop an editing event before the Text class bindings see it."""
+        return "break"
+
+
 class ConnectionWizard:
     """
     Step-by-step connection wizard for P2P chat.
@@ -38,10 +223,151 @@ class ConnectionWizard:
     6. Connection status and waiting
     """
     
+    # Every instance attribute, including the step widgets the builders create
+    __slots__ = (
+        # Wizard state
+        "parent", "current_step", "step_history", "username", "connection_type",
+        "invite_key", "return_key",
+        # Layout frames
+        "content_frame", "navigation_frame", "progress_frame", "content_host", "wizard_frame",
+        # Progress indicators
+        "progress_canvas", "_scaling", "step_indicators", "_step_items_by_enum", "_indicator_x",
+        "_current_step_index", "_indicator_state", "_prev_visible_set", "_last_indicator_state",
+        # Callbacks
+        "on_create_chat", "on_join_chat", "on_connect_chat", "on_wizard_complete", "on_wizard_cancel",
+        # Button commands and step builders
+        "_cmd_create", "_cmd_join", "_cmd_share_invite", "_cmd_wait_for_return", "_step_builders",
+        # Step content and scheduling
+        "_step_contents", "_visible_content", "_batch_depth", "_tooltips", "_after_ids",
+        # Step widgets
+        "back_btn", "next_btn", "continue_btn", "create_btn", "join_btn", "username_entry",
+        "join_entry", "join_error_label", "join_submit_btn", "return_entry", "return_error_label",
+        "connect_btn", "invite_text", "copy_invite_btn", "next_step_btn", "return_display_text",
+        "copy_return_btn", "progress_bar",
+    )
+    
+    # Step order of each flow, keyed by connection type (None until one is chosen)
+    _STEP_ORDERS = {
+        "create": (
+            WizardStep.WELCOME,
+            WizardStep.USERNAME,
+            WizardStep.CONNECTION_TYPE,
+            WizardStep.CREATE_CHAT,
+            WizardStep.SHARE_INVITE,
+            WizardStep.WAIT_FOR_RETURN,
+            WizardStep.WAITING_CONNECTION
+        ),
+        "join": (
+            WizardStep.WELCOME,
+            WizardStep.USERNAME,
+            WizardStep.CONNECTION_TYPE,
+            WizardStep.JOIN_CHAT,
+            WizardStep.SHARE_RETURN,
+            WizardStep.WAITING_CONNECTION
+        ),
+        None: (
+            WizardStep.WELCOME,
+            WizardStep.USERNAME,
+            WizardStep.CONNECTION_TYPE
+        ),
+    }
+    
+    # Position of each step within its flow
+    _STEP_INDEX = {
+        flow: {step: i for i, step in enumerate(order)}
+        for flow, order in _STEP_ORDERS.items()
+    }
+    
+    # Steps shared by every flow, drawn with larger indicator numbers
+    _COMMON_STEPS = frozenset(_STEP_ORDERS[None])
+    
+    # Every step indicator as (number, step), in display order
+    _ALL_STEPS = tuple(
+        (str(number), step)
+        for number, step in enumerate((
+            WizardStep.WELCOME,
+            WizardStep.USERNAME,
+            WizardStep.CONNECTION_TYPE,
+            WizardStep.CREATE_CHAT,
+            WizardStep.JOIN_CHAT,
+            WizardStep.SHARE_INVITE,
+            WizardStep.SHARE_RETURN,
+            WizardStep.WAIT_FOR_RETURN,
+            WizardStep.WAITING_CONNECTION
+        ), start=1)
+    )
+    
+    # Title and instruction text of the steps built on _new_step_content()
+    _STEP_HEADINGS: Dict[WizardStep, Tuple[str, Optional[str]]] = {
+        WizardStep.USERNAME: (
+            "👤 Choose Your Display Name",
+            "Enter a name that will be displayed to other participants.\n"
+            "This can be changed later in the chat settings."
+        ),
+        WizardStep.CREATE_CHAT: (
+            "🚀 Creating Your Chat Room",
+            "Your secure chat room is being created...\n"
+            "You'll be able to share your invite key in the next step."
+        ),
+        WizardStep.JOIN_CHAT: (
+            "🔗 Joining a Chat Room",
+            "Paste the invite key you received from the chat creator below.\n"
+            "You'll then receive a return key to share back with them."
+        ),
+        WizardStep.SHARE_INVITE: (
+            "📤 Share Your Invite Key",
+            "Copy and share this invite key with the person you want to chat with.\n"
+            "They will need to enter it in their app to join your chat."
+        ),
+        WizardStep.WAIT_FOR_RETURN: (
+            "⏳ Waiting for Return Key",
+            "Wait for your peer to send you their return key.\n"
+            "Once you receive it, paste it below to establish the connection."
+        ),
+        WizardStep.SHARE_RETURN: (
+            "📤 Share Your Return Key",
+            "Copy and share this return key with the chat creator.\n"
+            "They will use it to complete the connection."
+        ),
+        WizardStep.WAITING_CONNECTION: ("⏳ Establishing Connection", None),
+    }
+    
+    # (light, dark) colours shared by the step builders
+    _C_TEXT = ("gray10", "gray90")
+    _C_SUB = ("gray40", "gray60")
+    _C_NOTE = ("gray30", "gray70")
+    _C_PLACEHOLDER = ("gray50", "gray50")
+    _C_BTN_FG = ("gray50", "gray30")
+    _C_BTN_HOV = ("gray60", "gray20")
+    _C_COPY_FG = ("gray45", "gray35")
+    _C_COPY_HOV = ("gray55", "gray25")
+    
+    # Step indicator row: one slot per step, sized for all nine steps
+    INDICATOR_SLOT_WIDTH = 60
+    INDICATOR_ROW_HEIGHT = 55
+    MAX_CONTAINER_WIDTH = len(_ALL_STEPS) * INDICATOR_SLOT_WIDTH
+    
+    # Next button label per step; the other steps hide it and use their own action buttons
+    _NEXT_BUTTON_TEXT: Dict[WizardStep, str] = {
+        WizardStep.WELCOME: "Get Started",
+        WizardStep.USERNAME: "Continue →",
+    }
+    
+    # Copy buttons show a check mark for a moment after copying
+    COPY_ICON = "📋"
+    COPIED_ICON = "✅"
+    COPY_FEEDBACK_MS = 1500
+    
+    # Steps remembered for the back button; the oldest are dropped beyond this
+    MAX_HISTORY = 32
+    
+    # Delay between building the not yet visited steps of the current flow in the background
+    PREBUILD_DELAY_MS = 50
+    
     def __init__(self, parent: ctk.CTk):
         self.parent = parent
         self.current_step = WizardStep.WELCOME
-        self.step_history = []
+        self.step_history: Deque[WizardStep] = deque(maxlen=self.MAX_HISTORY)
         
         # Wizard data
         self.username = "Anonymous"
@@ -53,8 +379,28 @@ class ConnectionWizard:
         self.content_frame: Optional[ctk.CTkFrame] = None
         self.navigation_frame: Optional[ctk.CTkFrame] = None
         self.progress_frame: Optional[ctk.CTkFrame] = None
+        self.content_host: Optional[ctk.CTkFrame] = None
         self.wizard_frame: Optional[ctk.CTk] = None  # Can be CTk or CTkFrame
-        self.step_indicators = []
+        self.progress_canvas: Optional[tk.Canvas] = None
+        self._scaling = 1.0
+        self.step_indicators: List[Tuple[int, int]] = []  # (circle, number) canvas item ids
+        self._step_items_by_enum: Dict[WizardStep, Tuple[int, int]] = {}
+        self._indicator_x: Dict[WizardStep, float] = {}  # Circle centres in the active flow
+        self._current_step_index = 0  # Position of current_step in the active flow
+        self._indicator_state: Dict[WizardStep, str] = {}  # "current", "completed", "pending" or "hidden"
+        self._prev_visible_set: Optional[FrozenSet[WizardStep]] = None
+        self._last_indicator_state: Optional[Tuple[WizardStep, Optional[str]]] = None
+        
+        # Step widgets used outside their builders; set back to None when destroyed
+        self.username_entry: Optional[ctk.CTkEntry] = None
+        self.join_entry: Optional[ctk.CTkTextbox] = None
+        self.return_entry: Optional[ctk.CTkTextbox] = None
+        self.invite_text: Optional[_ReadonlyTextbox] = None
+        self.return_display_text: Optional[_ReadonlyTextbox] = None
+        self.copy_invite_btn: Optional[ctk.CTkButton] = None
+        self.copy_return_btn: Optional[ctk.CTkButton] = None
+        self.join_error_label: Optional[ctk.CTkLabel] = None
+        self.return_error_label: Optional[ctk.CTkLabel] = None
         
         # Callbacks
         self.on_create_chat: Optional[Callable] = None
@@ -63,34 +409,115 @@ class ConnectionWizard:
         self.on_wizard_complete: Optional[Callable] = None
         self.on_wizard_cancel: Optional[Callable] = None
         
-        # UI state
-        self.current_content = None
+        # Button commands, bound once
+        self._cmd_create = functools.partial(self._select_connection_type, "create")
+        self._cmd_join = functools.partial(self._select_connection_type, "join")
+        self._cmd_share_invite = functools.partial(self._show_step, WizardStep.SHARE_INVITE)
+        self._cmd_wait_for_return = functools.partial(self._show_step, WizardStep.WAIT_FOR_RETURN)
+        
+        # Builder for each step's content frame
+        self._step_builders: Dict[WizardStep, Callable[[], ctk.CTkFrame]] = {
+            WizardStep.WELCOME: self._build_welcome_step,
+            WizardStep.USERNAME: self._build_username_step,
+            WizardStep.CONNECTION_TYPE: self._build_connection_type_step,
+            WizardStep.CREATE_CHAT: self._build_create_chat_step,
+            WizardStep.SHARE_INVITE: self._build_share_invite_step,
+            WizardStep.WAIT_FOR_RETURN: self._build_wait_for_return_step,
+            WizardStep.JOIN_CHAT: self._build_join_chat_step,
+            WizardStep.SHARE_RETURN: self._build_share_return_step,
+            WizardStep.WAITING_CONNECTION: self._build_waiting_connection_step,
+        }
+        
+        # UI state - step contents are built on first visit and kept for reuse
+        self._step_contents: Dict[WizardStep, ctk.CTkFrame] = {}
+        self._visible_content: Optional[ctk.CTkFrame] = None
+        self._batch_depth = 0
+        self._tooltips = _TooltipManager()
+        
+        # Pending after() callbacks by name, cancelled together in hide()
+        self._after_ids: Dict[str, str] = {}
         
     def show(self) -> None:
         """Show the connection wizard."""
+        # The wizard UI is built once; showing it again only returns to the welcome step
+        if self.content_host is not None:
+            self.step_history.clear()
+            self._show_step(WizardStep.WELCOME)
+            return
+        
         self._create_wizard_frame()
-        self._setup_ui()
-        self._show_step(WizardStep.WELCOME)
+        with self._batch():
+            self._setup_ui()
+            self._show_step(WizardStep.WELCOME)
+    
+    def _track_widget(self, name: str) -> None:
+        """Reset the step widget attribute name to None when its widget is destroyed."""
+        widget = getattr(self, name)
+        widget.bind("<Destroy>", functools.partial(self._on_widget_destroy, name, widget))
+    
+    def _on_widget_destroy(self, name: str, widget, event=None) -> None:
+        """Forget a destroyed step widget, unless the attribute already holds a newer one."""
+        if getattr(self, name) is widget:
+            setattr(self, name, None)
+    
+    def _schedule(self, name: str, delay_ms: Optional[int], callback: Callable[[], None]) -> None:
+        """
+        Run callback after delay_ms, or when idle if delay_ms is None.
+        
+        A pending callback with the same name is replaced; callback must pop
+        its name from _after_ids when it runs.
+        """
+        after_id = self._after_ids.get(name)
+        if after_id is not None:
+            self.parent.after_cancel(after_id)
+        if delay_ms is None:
+            self._after_ids[name] = self.parent.after_idle(callback)
+        else:
+            self._after_ids[name] = self.parent.after(delay_ms, callback)
+    
+    def _cancel_scheduled(self) -> None:
+        """Cancel every pending callback from _schedule()."""
+        for after_id in self._after_ids.values():
+            self.parent.after_cancel(after_id)
+        self._after_ids.clear()
+    
+    @contextmanager
+    def _batch(self):
+        """
+        Group the widget changes of one step transition.
+        
+        Nested batches are allowed; pending geometry and redraws are flushed
+        once, when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self.wizard_frame:
+                self.wizard_frame.update_idletasks()
     
     def _create_wizard_frame(self) -> None:
         """Create the main wizard frame."""
+        # The parent's layout survives hide(), so it is only configured on the first show
+        if self.wizard_frame is not None:
+            return
+        
         # Use the parent directly instead of creating a nested frame
         self.wizard_frame = self.parent
-        # Configure the parent frame for wizard layout
+        # Configure the parent frame for wizard layout (rows keep their natural height)
         if self.wizard_frame:
             self.wizard_frame.grid_columnconfigure(0, weight=1)
-        # Don't give weight to content area - let it expand naturally
-        # self.wizard_frame.grid_rowconfigure(2, weight=1)  # Content area
         
     def _setup_ui(self) -> None:
         """Set up the wizard UI structure."""
         # Header with title and progress
         self._setup_header()
         
-        # Content area - use wizard frame directly for content
-        # Note: content_frame is used as a reference to wizard_frame for content placement
-        if self.wizard_frame:
-            self.wizard_frame.grid_columnconfigure(0, weight=1)
+        # Persistent host for the step contents; steps are swapped inside it
+        self.content_host = ctk.CTkFrame(self.wizard_frame, corner_radius=0, fg_color="transparent")
+        self.content_host.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
+        self.content_host.grid_columnconfigure(0, weight=1)
         
         # Navigation area
         self._setup_navigation()
@@ -100,13 +527,22 @@ class ConnectionWizard:
         # Progress indicators - positioned much closer to top
         self.progress_frame = ctk.CTkFrame(self.wizard_frame, fg_color="transparent")
         self.progress_frame.grid(row=0, column=0, pady=(2, 0), padx=20, sticky="ew")
-        self.progress_frame.grid_columnconfigure(0, weight=1)  # Center the steps container
-        
-        # Create a dynamic-width container for the steps - compact height
-        self.steps_container = ctk.CTkFrame(self.progress_frame, fg_color="transparent", height=55)
-        self.steps_container.grid(row=0, column=0, sticky="n")  # Align to top
-        self.steps_container.grid_propagate(False)
-        # Initial configuration will be set by _update_progress_indicators()
+        self.progress_frame.grid_columnconfigure(0, weight=1)  # Center the progress canvas
+        
+        # All step indicators are drawn on one fixed-size canvas - compact height
+        self._scaling = ctk.ScalingTracker.get_widget_scaling(self.progress_frame)
+        self.progress_canvas = tk.Canvas(
+            self.progress_frame,
+            width=round(self.MAX_CONTAINER_WIDTH * self._scaling),
+            height=round(self.INDICATOR_ROW_HEIGHT * self._scaling),
+            bg=self._mode_color(self.progress_frame.cget("bg_color")),
+            highlightthickness=0,
+            borderwidth=0
+        )
+        self.progress_canvas.grid(row=0, column=0, sticky="n")  # Align to top
+        ctk.AppearanceModeTracker.add(self._on_appearance_mode_change, self.progress_canvas)
+        self.progress_canvas.bind("<Destroy>", self._on_progress_canvas_destroy, add="+")
+        # Indicators are created by _update_progress_indicators()
         
         self._update_progress_indicators()
     
@@ -115,7 +551,6 @@ class ConnectionWizard:
         self.navigation_frame = ctk.CTkFrame(self.wizard_frame, fg_color="transparent")
         self.navigation_frame.grid(row=2, column=0, sticky="ew", padx=20, pady=(5, 10))
         self.navigation_frame.grid_columnconfigure(0, weight=1)
-        self.navigation_frame.grid_columnconfigure(1, weight=0)
         
         # Back button (initially hidden)
         self.back_btn = ctk.CTkButton(
@@ -123,7 +558,7 @@ class ConnectionWizard:
             text="← Back",
             width=100,
             height=35,
-            font=ctk.CTkFont(size=14),
+            font=_get_font(14),
             corner_radius=8,
             command=self._go_back,
             fg_color=("gray60", "gray40"),
@@ -133,405 +568,375 @@ class ConnectionWizard:
         
         
         # Next/Complete button (initially hidden)
-        self.next_btn = ctk.CTkButton(
-            self.navigation_frame,
-            text="Next →",
-            width=100,
-            height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=8,
-            command=self._go_next,
-            fg_color=("gray50", "gray30"),
-            hover_color=("gray60", "gray20")
-        )
+        self.next_btn = self._action_button(self.navigation_frame, "Next →", self._go_next, width=100)
         self.next_btn.grid(row=0, column=1, sticky="e", padx=(0, 10))
     
     def _update_progress_indicators(self) -> None:
-        """Update the progress step indicators with stable positioning - no flickering."""
-        # Define all possible steps in order (maximum 7 steps)
-        all_steps = [
-            ("1", WizardStep.WELCOME),
-            ("2", WizardStep.USERNAME),
-            ("3", WizardStep.CONNECTION_TYPE),
-            ("4", WizardStep.CREATE_CHAT),
-            ("5", WizardStep.JOIN_CHAT),
-            ("6", WizardStep.SHARE_INVITE),
-            ("7", WizardStep.SHARE_RETURN),
-            ("8", WizardStep.WAIT_FOR_RETURN),
-            ("9", WizardStep.WAITING_CONNECTION)
-        ]
-        
-        # Determine which steps should be visible based on connection type
-        if self.connection_type == "create":
-            visible_step_enums = [
-                WizardStep.WELCOME,
-                WizardStep.USERNAME,
-                WizardStep.CONNECTION_TYPE,
-                WizardStep.CREATE_CHAT,
-                WizardStep.SHARE_INVITE,
-                WizardStep.WAIT_FOR_RETURN,
-                WizardStep.WAITING_CONNECTION
-            ]
-        elif self.connection_type == "join":
-            visible_step_enums = [
-                WizardStep.WELCOME,
-                WizardStep.USERNAME,
-                WizardStep.CONNECTION_TYPE,
-                WizardStep.JOIN_CHAT,
-                WizardStep.SHARE_RETURN,
-                WizardStep.WAITING_CONNECTION
-            ]
-        else:
-            visible_step_enums = [
-                WizardStep.WELCOME,
-                WizardStep.USERNAME,
-                WizardStep.CONNECTION_TYPE
-            ]
-        
-        # Create indicators if they don't exist (only once)
-        if not self.step_indicators:
-            # Create all possible indicators (9 max) but hide them initially
-            for i, (number, step_enum) in enumerate(all_steps):
-                step_frame = ctk.CTkFrame(
-                    self.steps_container,
-                    width=38,
-                    height=38,
-                    corner_radius=19,
-                    fg_color=("gray60", "gray40")
-                )
-                step_frame.grid(row=0, column=i, padx=8, pady=3, sticky="")
-                step_frame.grid_propagate(False)
-                step_frame.grid_remove()  # Hide by default
-                
-                # Make first 3 steps bigger initially
-                initial_font_size = 22 if number in ["1", "2", "3"] else 18
-                step_label = ctk.CTkLabel(
-                    step_frame,
-                    text=number,
-                    font=ctk.CTkFont(size=initial_font_size, weight="bold"),
-                    text_color=("gray30", "gray70"),
-                    fg_color="transparent"
-                )
-                step_label.place(relx=0.5, rely=0.5, anchor="center")
-                self.step_indicators.append(step_frame)
-        
-        # Calculate container width based on visible steps
-        step_width = 60
-        container_width = len(visible_step_enums) * step_width
-        container_width = max(container_width, 200)
-        self.steps_container.configure(width=container_width)
-        
-        # Clear all column configurations
-        for i in range(9):  # Clear all 9 columns
-            self.steps_container.grid_columnconfigure(i, weight=0)
-        
-        # Show/hide and configure visible indicators
-        visible_count = 0
-        for i, (number, step_enum) in enumerate(all_steps):
-            if i < len(self.step_indicators):
-                step_frame = self.step_indicators[i]
-                
-                if step_enum in visible_step_enums:
-                    # Show this step
-                    step_frame.grid()
-                    self.steps_container.grid_columnconfigure(visible_count, weight=1)
-                    
-                    # Determine if this step is current or completed
-                    is_current = self.current_step == step_enum
-                    is_completed = self._is_step_completed(step_enum)
-                    
-                    # Set color based on status
-                    if is_current:
-                        fg_color = ("#4A90E2", "#4A90E2")  # Blue
-                        text_color = ("white", "white")
-                    elif is_completed:
-                        fg_color = ("#5CB85C", "#5CB85C")  # Green
-                        text_color = ("white", "white")
-                    else:
-                        fg_color = ("gray60", "gray40")  # Grey
-                        text_color = ("gray30", "gray70")
-                    
-                    # Update frame properties
-                    if is_current:
-                        step_frame.configure(
-                            width=48,
-                            height=48,
-                            corner_radius=24,
-                            fg_color=fg_color
-                        )
-                        step_frame.grid_configure(padx=6, pady=3)
-                    else:
-                        step_frame.configure(
-                            width=38,
-                            height=38,
-                            corner_radius=19,
-                            fg_color=fg_color
-                        )
-                        step_frame.grid_configure(padx=8, pady=3)
-                    
-                    # Update label properties
-                    # Make first 3 steps bigger (steps 1, 2, 3)
-                    if number in ["1", "2", "3"]:
-                        font_size = 26 if is_current else 22
-                    else:
-                        font_size = 22 if is_current else 18
-                    step_label = step_frame.winfo_children()[0]
-                    step_label.configure(
-                        text=number,
-                        font=ctk.CTkFont(size=font_size, weight="bold"),
-                        text_color=text_color
-                    )
-                    
-                    visible_count += 1
-                else:
-                    # Hide this step
-                    step_frame.grid_remove()
-    
-    def _resize_window_to_content(self) -> None:
-        """
-        Resize the window to fit the content height.
-        
-        NOTE: This method is currently disabled to prevent constant window resizing
-        during wizard navigation. The main window is now set to a fixed large size
-        (1000x800) that accommodates all wizard steps without needing resizing.
-        """
-        if not self.current_content:
+        """Update the progress step indicators, touching only the ones whose state changed."""
+        # Nothing to do if neither the step nor the flow changed since the last update
+        step_and_flow = (self.current_step, self.connection_type)
+        if step_and_flow == self._last_indicator_state:
             return
         
-        # Get the actual root window (not the frame)
-        root_window = self.parent.winfo_toplevel()
-        
-        # Update the window to calculate the required size
-        root_window.update_idletasks()
-        
-        # Get the current window size
-        current_width = root_window.winfo_width()
-        current_height = root_window.winfo_height()
-        
-        # Calculate the required height by measuring the entire wizard frame
-        wizard_height = self.wizard_frame.winfo_reqheight() if self.wizard_frame else 0
+        # Steps visible for the current connection type
+        visible_step_enums = self._STEP_ORDERS[self.connection_type]
+        canvas = self.progress_canvas
         
-        # Add extra padding for window decorations, borders, and safety margin
-        # Increased padding to ensure title and all elements are visible
-        window_padding = 250  # Extra padding for window title bar, borders, etc.
-        
-        required_height = wizard_height + window_padding
-        
-        # Set minimum height - increased to ensure title is always visible
-        min_height = 600
-        new_height = max(required_height, min_height)
-        
-        # Debug information
-        print(f"Debug - Wizard height: {wizard_height}, Required: {required_height}, New: {new_height}, Current: {current_height}")
-        
-        # Only resize if the height has changed significantly and not in fullscreen
-        if abs(new_height - current_height) > 50:  # Increased threshold to prevent constant resizing
-            try:
-                # Check if window is in fullscreen mode
-                if not root_window.attributes('-fullscreen'):
-                    root_window.geometry(f"{current_width}x{new_height}")
-                else:
-                    # In fullscreen, just ensure content is properly centered
-                    self._center_content_in_fullscreen()
-            except Exception as e:
-                # If resizing fails, just log it and continue
-                print(f"Window resize failed: {e}")
-    
-    def _center_content_in_fullscreen(self) -> None:
-        """Center content when in fullscreen mode."""
-        try:
-            # Get the root window
-            root_window = self.parent.winfo_toplevel()
+        # Create the indicator items if they don't exist (only once), hidden until placed
+        if not self.step_indicators:
+            for number, step_enum in self._ALL_STEPS:
+                oval_id = canvas.create_oval(0, 0, 0, 0, outline="", state="hidden")
+                text_id = canvas.create_text(0, 0, text=number, state="hidden")
+                self.step_indicators.append((oval_id, text_id))
+                self._step_items_by_enum[step_enum] = self.step_indicators[-1]
+        
+        visible_set = frozenset(visible_step_enums)
+        if visible_set != self._prev_visible_set:
+            # Hide the indicators that left the flow
+            for step_enum in (self._prev_visible_set or ()):
+                if step_enum not in visible_set:
+                    for item_id in self._step_items_by_enum[step_enum]:
+                        canvas.itemconfigure(item_id, state="hidden")
+                    self._indicator_state[step_enum] = "hidden"
             
-            # Get screen dimensions
-            screen_width = root_window.winfo_screenwidth()
-            screen_height = root_window.winfo_screenheight()
+            # Centre the visible indicators in the row, one slot each; they moved,
+            # so forget their drawn state to have them redrawn below
+            slot = self.INDICATOR_SLOT_WIDTH * self._scaling
+            first_x = (self.MAX_CONTAINER_WIDTH * self._scaling - slot * len(visible_step_enums)) / 2
+            for i, step_enum in enumerate(visible_step_enums):
+                self._indicator_x[step_enum] = first_x + slot * (i + 0.5)
+                for item_id in self._step_items_by_enum[step_enum]:
+                    canvas.itemconfigure(item_id, state="normal")
+                self._indicator_state.pop(step_enum, None)
+            self._prev_visible_set = visible_set
+        
+        self._last_indicator_state = step_and_flow
+        
+        current_index = self._current_step_index
+        center_y = self.INDICATOR_ROW_HEIGHT * self._scaling / 2
+        for i, step_enum in enumerate(visible_step_enums):
+            # Only redraw indicators whose state actually changed
+            if i == current_index:
+                state = "current"
+            elif i < current_index:
+                state = "completed"
+            else:
+                state = "pending"
+            if self._indicator_state.get(step_enum) == state:
+                continue
+            self._indicator_state[step_enum] = state
             
-            # Calculate wizard content dimensions
-            if self.wizard_frame:
-                wizard_width = self.wizard_frame.winfo_reqwidth()
-                wizard_height = self.wizard_frame.winfo_reqheight()
-                
-                # Center the wizard frame
-                x_offset = (screen_width - wizard_width) // 2
-                y_offset = (screen_height - wizard_height) // 2
-                
-                # Apply centering by adjusting grid configuration
-                # Only apply grid_configure if it's a frame, not the main window
-                try:
-                    # Use getattr to avoid type checker issues
-                    grid_configure = getattr(self.wizard_frame, 'grid_configure', None)
-                    if grid_configure:
-                        grid_configure(padx=x_offset//2, pady=y_offset//2)
-                except Exception:
-                    # CTk doesn't have grid_configure, skip centering
-                    pass
+            oval_id, text_id = self._step_items_by_enum[step_enum]
+            is_current = state == "current"
+            is_completed = state == "completed"
             
-        except Exception as e:
-            print(f"Error centering content in fullscreen: {e}")
+            # Set color based on status
+            if is_current:
+                fg_color = ("#4A90E2", "#4A90E2")  # Blue
+                text_color = ("white", "white")
+            elif is_completed:
+                fg_color = ("#5CB85C", "#5CB85C")  # Green
+                text_color = ("white", "white")
+            else:
+                fg_color = ("gray60", "gray40")  # Grey
+                text_color = ("gray30", "gray70")
+            
+            # Update circle: the current step is drawn larger
+            radius = (24 if is_current else 19) * self._scaling
+            x = self._indicator_x[step_enum]
+            canvas.coords(oval_id, x - radius, center_y - radius, x + radius, center_y + radius)
+            canvas.itemconfigure(oval_id, fill=self._mode_color(fg_color))
+            
+            # Update number
+            # Make the common steps bigger (steps 1, 2, 3)
+            if step_enum in self._COMMON_STEPS:
+                font_size = 26 if is_current else 22
+            else:
+                font_size = 22 if is_current else 18
+            canvas.coords(text_id, x, center_y)
+            canvas.itemconfigure(
+                text_id,
+                font=_get_font(font_size, "bold").create_scaled_tuple(self._scaling),
+                fill=self._mode_color(text_color)
+            )
+    
+    @staticmethod
+    def _mode_color(color):
+        """Pick the variant of a CTk (light, dark) colour for the current appearance mode."""
+        if isinstance(color, (tuple, list)):
+            return color[0] if ctk.get_appearance_mode() == "Light" else color[1]
+        return color
+    
+    def _on_appearance_mode_change(self, mode_string: str) -> None:
+        """Recolour the progress canvas after a light/dark theme switch."""
+        if not self.progress_canvas.winfo_exists():
+            return
+        self.progress_canvas.configure(bg=self._mode_color(self.progress_frame.cget("bg_color")))
+        
+        # Forget the drawn state so every visible indicator is restyled
+        self._indicator_state.clear()
+        self._last_indicator_state = None
+        self._update_progress_indicators()
+    
+    def _on_progress_canvas_destroy(self, event) -> None:
+        """Stop following appearance mode changes once the progress canvas is gone."""
+        if event.widget is self.progress_canvas:
+            ctk.AppearanceModeTracker.remove(self._on_appearance_mode_change)
+    
+    def _schedule_progress_update(self) -> None:
+        """Update the progress indicators from the idle queue, after the step content."""
+        if "progress" in self._after_ids:
+            return
+        self._schedule("progress", None, self._run_progress_update)
+    
+    def _run_progress_update(self) -> None:
+        """Run a scheduled progress indicator update unless the wizard was torn down."""
+        self._after_ids.pop("progress", None)
+        if self.progress_canvas.winfo_exists():
+            self._update_progress_indicators()
     
     def _is_step_completed(self, step: WizardStep) -> bool:
         """Check if a step has been completed."""
-        # Define the step order for each flow
-        if self.connection_type == "create":
-            step_order = [
-                WizardStep.WELCOME,
-                WizardStep.USERNAME, 
-                WizardStep.CONNECTION_TYPE,
-                WizardStep.CREATE_CHAT,
-                WizardStep.SHARE_INVITE,
-                WizardStep.WAIT_FOR_RETURN,
-                WizardStep.WAITING_CONNECTION
-            ]
-        elif self.connection_type == "join":
-            step_order = [
-                WizardStep.WELCOME,
-                WizardStep.USERNAME,
-                WizardStep.CONNECTION_TYPE, 
-                WizardStep.JOIN_CHAT,
-                WizardStep.SHARE_RETURN,
-                WizardStep.WAITING_CONNECTION
-            ]
-        else:
-            step_order = [
-                WizardStep.WELCOME,
-                WizardStep.USERNAME,
-                WizardStep.CONNECTION_TYPE
-            ]
-        
-        # Find the current step index
-        try:
-            current_index = step_order.index(self.current_step)
-        except ValueError:
-            current_index = 0
+        step_index = self._STEP_INDEX[self.connection_type]
         
-        # Find the step index we're checking
-        try:
-            step_index = step_order.index(step)
-        except ValueError:
+        # A step is completed if it comes before the current step in this flow
+        index = step_index.get(step)
+        if index is None:
             return False
-        
-        # A step is completed if it comes before the current step
-        return step_index < current_index
-    
-    def _show_step(self, step: WizardStep) -> None:
-        """Show a specific wizard step."""
-        # Clear current content
-        if self.current_content:
-            self.current_content.destroy()
-            self.current_content = None
-        
-        # Add to history
-        if not self.step_history or self.step_history[-1] != step:
-            self.step_history.append(step)
-        
-        self.current_step = step
-        
-        # Show step content
-        if step == WizardStep.WELCOME:
-            self._show_welcome_step()
-        elif step == WizardStep.USERNAME:
-            self._show_username_step()
-        elif step == WizardStep.CONNECTION_TYPE:
-            self._show_connection_type_step()
-        elif step == WizardStep.CREATE_CHAT:
-            self._show_create_chat_step()
-        elif step == WizardStep.SHARE_INVITE:
-            self._show_share_invite_step()
+        return index < self._current_step_index
+    
+    def _show_step(self, step: WizardStep, record: bool = True) -> None:
+        """Show a specific wizard step; back navigation passes record=False to leave the history alone."""
+        with self._batch():
+            # Add to history, unless the step is already on top
+            if record and (not self.step_history or self.step_history[-1] != step):
+                self.step_history.append(step)
+            
+            self.current_step = step
+            self._current_step_index = self._STEP_INDEX[self.connection_type].get(step, 0)
+            
+            # Build the step content on first visit, then reuse it
+            content = self._step_contents.get(step)
+            if content is None:
+                content = self._step_builders[step]()
+                self._step_contents[step] = content
+            
+            # Swap the visible content
+            if self._visible_content is not content:
+                if self._visible_content is not None:
+                    self._visible_content.grid_remove()
+                content.grid(row=0, column=0, sticky="ew")
+                self._visible_content = content
+            
+            # Update navigation now; the progress row follows once the content is laid out
+            self._update_navigation()
+            self._schedule_progress_update()
+            self._schedule_prebuild()
+    
+    def _schedule_prebuild(self) -> None:
+        """Queue building the next not yet visited step of the current flow."""
+        if "prebuild" in self._after_ids:
+            return
+        for step in self._STEP_ORDERS[self.connection_type]:
+            if step not in self._step_contents:
+                # A timer, not after_idle: _batch's update_idletasks would run idle work at once
+                self._schedule("prebuild", self.PREBUILD_DELAY_MS, self._prebuild_next_step)
+                return
+    
+    def _prebuild_next_step(self) -> None:
+        """Build one step of the current flow ahead of its first visit, then queue the next."""
+        self._after_ids.pop("prebuild", None)
+        for step in self._STEP_ORDERS[self.connection_type]:
+            if step not in self._step_contents:
+                self._step_contents[step] = self._step_builders[step]()
+                break
+        self._schedule_prebuild()
+    
+    def _reset_step(self, step: WizardStep) -> None:
+        """Clear the user data shown in a cached step frame, keeping its widgets."""
+        if step == WizardStep.JOIN_CHAT:
+            self._restore_placeholder(self.join_entry)
+            self.join_error_label.grid_remove()
         elif step == WizardStep.WAIT_FOR_RETURN:
-            self._show_wait_for_return_step()
-        elif step == WizardStep.JOIN_CHAT:
-            self._show_join_chat_step()
+            self._restore_placeholder(self.return_entry)
+            self.return_error_label.grid_remove()
+        elif step == WizardStep.SHARE_INVITE:
+            self.invite_text.delete("0.0", "end")
         elif step == WizardStep.SHARE_RETURN:
-            self._show_share_return_step()
-        elif step == WizardStep.WAITING_CONNECTION:
-            self._show_waiting_connection_step()
+            self.return_display_text.delete("0.0", "end")
+    
+    def _action_button(self, parent, text: str, command: Callable, width: int = 160) -> ctk.CTkButton:
+        """Create a wizard action button in the shared style; the caller grids it."""
+        return ctk.CTkButton(
+            parent,
+            text=text,
+            width=width,
+            height=35,
+            font=_get_font(14, "bold"),
+            corner_radius=8,
+            command=command,
+            fg_color=self._C_BTN_FG,
+            hover_color=self._C_BTN_HOV
+        )
+    
+    def _new_step_content(self, step: WizardStep) -> ctk.CTkFrame:
+        """Create a step frame with the title and instructions from _STEP_HEADINGS."""
+        title, instructions = self._STEP_HEADINGS[step]
+        content = ctk.CTkFrame(self.content_host, corner_radius=0)
+        content.grid_columnconfigure(0, weight=1)
         
-        # Update navigation
-        self._update_navigation()
-        self._update_progress_indicators()
+        # Title
+        title_label = ctk.CTkLabel(
+            content,
+            text=title,
+            font=_get_font(20, "bold"),
+            text_color=self._C_TEXT
+        )
+        title_label.grid(row=0, column=0, pady=(0, 15))
+        
+        # Instructions
+        if instructions:
+            instructions_label = ctk.CTkLabel(
+                content,
+                text=instructions,
+                font=_get_font(12),
+                text_color=self._C_SUB,
+                justify="center"
+            )
+            instructions_label.grid(row=1, column=0, pady=(0, 20))
+        
+        return content
+    
+    def _build_key_input(self, content: ctk.CTkFrame, label_text: str, name: str, placeholder: str,
+                         error_text: str) -> ctk.CTkLabel:
+        """
+        Add a labelled key input textbox in rows 2-3 of content, stored as self.<name>.
+        
+        Returns the inline error label in row 4, hidden until the input is rejected.
+        """
+        key_label = ctk.CTkLabel(
+            content,
+            text=label_text,
+            font=_get_font(16, "bold"),
+            text_color=self._C_NOTE
+        )
+        key_label.grid(row=2, column=0, pady=(15, 10))
+        
+        entry = ctk.CTkTextbox(
+            content,
+            height=100,
+            font=_get_font(12, family="monospace"),
+            corner_radius=8
+        )
+        entry.grid(row=3, column=0, sticky="ew", padx=0, pady=(0, 15))
+        setattr(self, name, entry)
+        self._track_widget(name)
+        
+        # Configure text selection colors and placeholder text
+        self._configure_textbox_selection_colors(entry)
+        self._setup_placeholder_text(entry, placeholder)
+        
+        error_label = ctk.CTkLabel(
+            content,
+            text=error_text,
+            font=_get_font(12),
+            text_color="red"
+        )
+        error_label.grid(row=4, column=0, pady=(0, 10))
+        error_label.grid_remove()
+        return error_label
+    
+    def _build_key_display(self, content: ctk.CTkFrame, label_text: str, copy_command: Callable,
+                           button_name: str, text_name: str) -> None:
+        """Add a read-only key display with a copy button in rows 2-3 of content."""
+        key_section = ctk.CTkFrame(content, fg_color="transparent")
+        key_section.grid(row=2, column=0, sticky="ew", pady=(15, 10))
+        key_section.grid_columnconfigure(0, weight=1)
+        
+        key_label = ctk.CTkLabel(
+            key_section,
+            text=label_text,
+            font=_get_font(16, "bold"),
+            text_color=self._C_NOTE
+        )
+        key_label.grid(row=0, column=0, sticky="w")
+        
+        copy_btn = ctk.CTkButton(
+            key_section,
+            text=self.COPY_ICON,
+            width=30,
+            height=30,
+            font=_get_font(14),
+            corner_radius=6,
+            command=copy_command,
+            fg_color=self._C_COPY_FG,
+            hover_color=self._C_COPY_HOV
+        )
+        copy_btn.grid(row=0, column=1, sticky="e", padx=(10, 0))
+        setattr(self, button_name, copy_btn)
+        self._track_widget(button_name)
         
-        # Disabled automatic resizing to prevent constant window resizing
-        # The window is now set to a fixed large size that accommodates all wizard steps
-        # self.parent.after(100, self._resize_window_to_content)
+        key_text = _ReadonlyTextbox(
+            content,
+            height=100,
+            font=_get_font(12, family="monospace"),
+            corner_radius=8
+        )
+        key_text.grid(row=3, column=0, sticky="ew", padx=0, pady=(0, 20))
+        setattr(self, text_name, key_text)
+        self._track_widget(text_name)
+        
+        # Configure text selection colors
+        self._configure_textbox_selection_colors(key_text)
     
-    def _show_welcome_step(self) -> None:
-        """Show the welcome step with simplified design."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
+    def _build_welcome_step(self) -> ctk.CTkFrame:
+        """Build the welcome step with simplified design."""
+        content = ctk.CTkFrame(self.content_host, corner_radius=0)
+        content.grid_columnconfigure(0, weight=1)
         
         # Welcome content
         welcome_label = ctk.CTkLabel(
-            self.current_content,
+            content,
             text="👋 Welcome to SuperSecureChat!",
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=("gray10", "gray90")
+            font=_get_font(24, "bold"),
+            text_color=self._C_TEXT
         )
         welcome_label.grid(row=0, column=0, pady=(10, 10))
         
-        # Features list
+        # Features list and instructions, one label for both blocks
         features_text = ctk.CTkLabel(
-            self.current_content,
+            content,
             text="🔒 End-to-end encrypted messaging\n"
                  "🌐 Direct peer-to-peer connection\n"
                  "📁 Secure file transfers\n"
                  "🎤 Real-time voice chat\n"
                  "🚫 No servers - complete privacy\n"
-                 "⚠️ Chats not saved - automatically lost on disconnect",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray40", "gray60"),
-            justify="center"
-        )
-        features_text.grid(row=1, column=0, pady=(0, 15))
-        
-        # Instructions
-        instructions_label = ctk.CTkLabel(
-            self.current_content,
-            text="This wizard will guide you through setting up a secure connection.\n"
+                 "⚠️ Chats not saved - automatically lost on disconnect\n\n"
+                 "This wizard will guide you through setting up a secure connection.\n"
                  "You can either create a new chat room or join an existing one.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray50", "gray50"),
+            font=_get_font(14),
+            text_color=self._C_SUB,
             justify="center"
         )
-        instructions_label.grid(row=2, column=0, pady=(0, 20))
-    
-    def _show_username_step(self) -> None:
-        """Show the username entry step with simplified design."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
-        
-        # Title
-        title_label = ctk.CTkLabel(
-            self.current_content,
-            text="👤 Choose Your Display Name",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=0, column=0, pady=(0, 15))
+        features_text.grid(row=1, column=0, pady=(0, 20))
         
-        # Instructions
-        instructions_label = ctk.CTkLabel(
-            self.current_content,
-            text="Enter a name that will be displayed to other participants.\n"
-                 "This can be changed later in the chat settings.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
-            justify="center"
-        )
-        instructions_label.grid(row=1, column=0, pady=(0, 20))
+        return content
+    
+    def _build_username_step(self) -> ctk.CTkFrame:
+        """Build the username entry step with simplified design."""
+        content = self._new_step_content(WizardStep.USERNAME)
         
         # Username entry
         self.username_entry = ctk.CTkEntry(
-            self.current_content,
+            content,
             placeholder_text="Enter your display name (optional)",
-            font=ctk.CTkFont(size=14),
+            font=_get_font(14),
             height=40,
             corner_radius=8,
             width=400
         )
         self.username_entry.grid(row=2, column=0, pady=(0, 15))
+        self._track_widget("username_entry")
         
         # Set current username if available
         if self.username != "Anonymous":
@@ -539,143 +944,102 @@ class ConnectionWizard:
         
         # Note
         note_label = ctk.CTkLabel(
-            self.current_content,
+            content,
             text="💡 Leave empty to use 'Anonymous'",
-            font=ctk.CTkFont(size=11),
-            text_color=("gray50", "gray50")
+            font=_get_font(11),
+            text_color=self._C_PLACEHOLDER
         )
         note_label.grid(row=3, column=0, pady=(0, 30))
+        
+        return content
     
-    
-    def _show_connection_type_step(self) -> None:
-        """Show the connection type selection step with simplified design."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
-        self.current_content.grid_columnconfigure(1, weight=1)
+    def _build_connection_type_step(self) -> ctk.CTkFrame:
+        """Build the connection type selection step with simplified design."""
+        content = ctk.CTkFrame(self.content_host, corner_radius=0)
+        content.grid_columnconfigure((0, 1), weight=1)
         
         # Title
         title_label = ctk.CTkLabel(
-            self.current_content,
+            content,
             text="🔗 Choose Connection Type",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
+            font=_get_font(20, "bold"),
+            text_color=self._C_TEXT
         )
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
         # Create chat option
-        create_frame = ctk.CTkFrame(self.current_content, corner_radius=0)
+        create_frame = ctk.CTkFrame(content, corner_radius=0)
         create_frame.grid(row=1, column=0, sticky="nsew", padx=(0, 10), pady=0)
         create_frame.grid_columnconfigure(0, weight=1)
         
         create_icon = ctk.CTkLabel(
             create_frame,
             text="🚀",
-            font=ctk.CTkFont(size=36)
+            font=_get_font(36)
         )
         create_icon.grid(row=0, column=0, pady=(20, 10))
         
         create_title = ctk.CTkLabel(
             create_frame,
             text="Create New Chat",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray10", "gray90")
+            font=_get_font(16, "bold"),
+            text_color=self._C_TEXT
         )
         create_title.grid(row=1, column=0, pady=(0, 10))
         
         create_desc = ctk.CTkLabel(
             create_frame,
             text="Start a new secure chat room\nand invite others to join",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
+            font=_get_font(12),
+            text_color=self._C_SUB,
             justify="center"
         )
         create_desc.grid(row=2, column=0, pady=(0, 15))
         
-        self.create_btn = ctk.CTkButton(
-            create_frame,
-            text="Create Chat",
-            width=150,
-            height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=8,
-            command=lambda: self._select_connection_type("create"),
-            fg_color=("gray50", "gray30"),
-            hover_color=("gray60", "gray20")
-        )
+        self.create_btn = self._action_button(create_frame, "Create Chat", self._cmd_create, width=150)
         self.create_btn.grid(row=3, column=0, pady=(0, 20))
         
         # Join chat option
-        join_frame = ctk.CTkFrame(self.current_content, corner_radius=0)
+        join_frame = ctk.CTkFrame(content, corner_radius=0)
         join_frame.grid(row=1, column=1, sticky="nsew", padx=(10, 0), pady=0)
         join_frame.grid_columnconfigure(0, weight=1)
         
         join_icon = ctk.CTkLabel(
             join_frame,
             text="🔗",
-            font=ctk.CTkFont(size=36)
+            font=_get_font(36)
         )
         join_icon.grid(row=0, column=0, pady=(20, 10))
         
         join_title = ctk.CTkLabel(
             join_frame,
             text="Join Existing Chat",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray10", "gray90")
+            font=_get_font(16, "bold"),
+            text_color=self._C_TEXT
         )
         join_title.grid(row=1, column=0, pady=(0, 10))
         
         join_desc = ctk.CTkLabel(
             join_frame,
             text="Connect to an existing\nchat room using an invite key",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
+            font=_get_font(12),
+            text_color=self._C_SUB,
             justify="center"
         )
         join_desc.grid(row=2, column=0, pady=(0, 15))
         
-        self.join_btn = ctk.CTkButton(
-            join_frame,
-            text="Join Chat",
-            width=150,
-            height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=8,
-            command=lambda: self._select_connection_type("join"),
-            fg_color=("gray50", "gray30"),
-            hover_color=("gray60", "gray20")
-        )
+        self.join_btn = self._action_button(join_frame, "Join Chat", self._cmd_join, width=150)
         self.join_btn.grid(row=3, column=0, pady=(0, 20))
-    
-    def _show_create_chat_step(self) -> None:
-        """Show the create chat step - just shows that chat is being created."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
         
-        # Title
-        title_label = ctk.CTkLabel(
-            self.current_content,
-            text="🚀 Creating Your Chat Room",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=0, column=0, pady=(0, 15))
-        
-        # Instructions
-        instructions_label = ctk.CTkLabel(
-            self.current_content,
-            text="Your secure chat room is being created...\n"
-                 "You'll be able to share your invite key in the next step.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
-            justify="center"
-        )
-        instructions_label.grid(row=1, column=0, pady=(0, 20))
+        return content
+    
+    def _build_create_chat_step(self) -> ctk.CTkFrame:
+        """Build the create chat step - just shows that chat is being created."""
+        content = self._new_step_content(WizardStep.CREATE_CHAT)
         
         # Progress indicator
         self.progress_bar = ctk.CTkProgressBar(
-            self.current_content,
+            content,
             width=300,
             height=20,
             corner_radius=8
@@ -684,333 +1048,94 @@ class ConnectionWizard:
         self.progress_bar.set(0.5)  # Indeterminate progress
         
         # Continue button (will be shown when invite key is ready)
-        self.continue_btn = ctk.CTkButton(
-            self.current_content,
-            text="📤 Share Invite Key →",
-            width=200,
-            height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=8,
-            command=lambda: self._show_step(WizardStep.SHARE_INVITE),
-            fg_color=("gray50", "gray30"),
-            hover_color=("gray60", "gray20")
-        )
+        self.continue_btn = self._action_button(content, "📤 Share Invite Key →", self._cmd_share_invite, width=200)
         self.continue_btn.grid(row=3, column=0, pady=(0, 30))
-    
-    def _show_join_chat_step(self) -> None:
-        """Show the join chat step."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
-        
-        # Title
-        title_label = ctk.CTkLabel(
-            self.current_content,
-            text="🔗 Joining a Chat Room",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=0, column=0, pady=(0, 15))
         
-        # Instructions
-        instructions_label = ctk.CTkLabel(
-            self.current_content,
-            text="Paste the invite key you received from the chat creator below.\n"
-                 "You'll then receive a return key to share back with them.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
-            justify="center"
-        )
-        instructions_label.grid(row=1, column=0, pady=(0, 20))
+        return content
+    
+    def _build_join_chat_step(self) -> ctk.CTkFrame:
+        """Build the join chat step."""
+        content = self._new_step_content(WizardStep.JOIN_CHAT)
         
         # Invite key input section
-        invite_label = ctk.CTkLabel(
-            self.current_content,
-            text="📨 Invite Key",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray30", "gray70")
-        )
-        invite_label.grid(row=2, column=0, pady=(15, 10))
-        
-        self.join_entry = ctk.CTkTextbox(
-            self.current_content,
-            height=100,
-            font=ctk.CTkFont(size=12, family="monospace"),
-            corner_radius=8
-        )
-        self.join_entry.grid(row=3, column=0, sticky="ew", padx=0, pady=(0, 15))
-        
-        # Configure text selection colors
-        self._configure_textbox_selection_colors(self.join_entry)
-        
-        # Set up placeholder text
-        self.join_entry_placeholder = "Paste the invite key here..."
-        self._setup_placeholder_text(self.join_entry, self.join_entry_placeholder)
+        self.join_error_label = self._build_key_input(content, "📨 Invite Key", "join_entry",
+                                                      "Paste the invite key here...",
+                                                      "❌ Please enter a valid invite key.")
         
         # Join button
-        self.join_submit_btn = ctk.CTkButton(
-            self.current_content,
-            text="🚀 Join Chat",
-            width=160,
-            height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=8,
-            command=self._on_join_with_key,
-            fg_color=("gray50", "gray30"),
-            hover_color=("gray60", "gray20")
-        )
-        self.join_submit_btn.grid(row=4, column=0, pady=(0, 20))
-    
-    def _show_share_invite_step(self) -> None:
-        """Show the share invite key step."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
-        
-        # Title
-        title_label = ctk.CTkLabel(
-            self.current_content,
-            text="📤 Share Your Invite Key",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=0, column=0, pady=(0, 15))
+        self.join_submit_btn = self._action_button(content, "🚀 Join Chat", self._on_join_with_key)
+        self.join_submit_btn.grid(row=5, column=0, pady=(0, 20))
         
-        # Instructions
-        instructions_label = ctk.CTkLabel(
-            self.current_content,
-            text="Copy and share this invite key with the person you want to chat with.\n"
-                 "They will need to enter it in their app to join your chat.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
-            justify="center"
-        )
-        instructions_label.grid(row=1, column=0, pady=(0, 20))
+        return content
+    
+    def _build_share_invite_step(self) -> ctk.CTkFrame:
+        """Build the share invite key step."""
+        content = self._new_step_content(WizardStep.SHARE_INVITE)
         
         # Invite key display section with copy button
-        invite_section = ctk.CTkFrame(self.current_content, fg_color="transparent")
-        invite_section.grid(row=2, column=0, sticky="ew", pady=(15, 10))
-        invite_section.grid_columnconfigure(0, weight=1)
-        invite_section.grid_columnconfigure(1, weight=0)
-        
-        invite_label = ctk.CTkLabel(
-            invite_section,
-            text="📤 Your Invite Key",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray30", "gray70")
-        )
-        invite_label.grid(row=0, column=0, sticky="w")
-        
-        self.copy_invite_btn = ctk.CTkButton(
-            invite_section,
-            text="📋",
-            width=30,
-            height=30,
-            font=ctk.CTkFont(size=14),
-            corner_radius=6,
-            command=self._copy_invite_key,
-            fg_color=("gray45", "gray35"),
-            hover_color=("gray55", "gray25")
-        )
-        self.copy_invite_btn.grid(row=0, column=1, sticky="e", padx=(10, 0))
-        
-        self.invite_text = ctk.CTkTextbox(
-            self.current_content,
-            height=100,
-            font=ctk.CTkFont(size=12, family="monospace"),
-            corner_radius=8,
-            state="disabled"
-        )
-        self.invite_text.grid(row=3, column=0, sticky="ew", padx=0, pady=(0, 20))
-        
-        # Configure text selection colors
-        self._configure_textbox_selection_colors(self.invite_text)
+        self._build_key_display(content, "📤 Your Invite Key", self._copy_invite_key, "copy_invite_btn", "invite_text")
         
         # Next step button
-        self.next_step_btn = ctk.CTkButton(
-            self.current_content,
-            text="⏳ Wait for Return Key →",
-            width=200,
-            height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=8,
-            command=lambda: self._show_step(WizardStep.WAIT_FOR_RETURN),
-            fg_color=("gray50", "gray30"),
-            hover_color=("gray60", "gray20")
-        )
+        self.next_step_btn = self._action_button(content, "⏳ Wait for Return Key →", self._cmd_wait_for_return, width=200)
         self.next_step_btn.grid(row=5, column=0, pady=(0, 30))
         
         # Add tooltip for the wait for return key button
-        self._add_tooltip(self.next_step_btn, 
-                         "IMPORTANT: First share your invite key above with your peer!\n\n"
-                         "Then click this button to wait for their return key.\n"
-                         "Once you receive their return key, paste it to complete the connection.")
-    
-    def _show_wait_for_return_step(self) -> None:
-        """Show the wait for return key step."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
+        self._tooltips.register(self.next_step_btn, 
+                                "IMPORTANT: First share your invite key above with your peer!\n\n"
+                                "Then click this button to wait for their return key.\n"
+                                "Once you receive their return key, paste it to complete the connection.")
         
-        # Title
-        title_label = ctk.CTkLabel(
-            self.current_content,
-            text="⏳ Waiting for Return Key",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=0, column=0, pady=(0, 15))
-        
-        # Instructions
-        instructions_label = ctk.CTkLabel(
-            self.current_content,
-            text="Wait for your peer to send you their return key.\n"
-                 "Once you receive it, paste it below to establish the connection.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
-            justify="center"
-        )
-        instructions_label.grid(row=1, column=0, pady=(0, 20))
+        return content
+    
+    def _build_wait_for_return_step(self) -> ctk.CTkFrame:
+        """Build the wait for return key step."""
+        content = self._new_step_content(WizardStep.WAIT_FOR_RETURN)
         
         # Return key input
-        return_label = ctk.CTkLabel(
-            self.current_content,
-            text="📥 Return Key (Paste Here)",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray30", "gray70")
-        )
-        return_label.grid(row=2, column=0, pady=(15, 10))
-        
-        self.return_entry = ctk.CTkTextbox(
-            self.current_content,
-            height=100,
-            font=ctk.CTkFont(size=12, family="monospace"),
-            corner_radius=8
-        )
-        self.return_entry.grid(row=3, column=0, sticky="ew", padx=0, pady=(0, 15))
-        
-        # Configure text selection colors
-        self._configure_textbox_selection_colors(self.return_entry)
-        
-        # Set up placeholder text
-        self.return_entry_placeholder = "Paste the return key from your peer here..."
-        self._setup_placeholder_text(self.return_entry, self.return_entry_placeholder)
+        self.return_error_label = self._build_key_input(content, "📥 Return Key (Paste Here)", "return_entry",
+                                                        "Paste the return key from your peer here...",
+                                                        "❌ Please enter a valid return key.")
         
         # Connect button
-        self.connect_btn = ctk.CTkButton(
-            self.current_content,
-            text="🔗 Connect Now",
-            width=160,
-            height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=8,
-            command=self._on_connect,
-            fg_color=("gray50", "gray30"),
-            hover_color=("gray60", "gray20")
-        )
-        self.connect_btn.grid(row=4, column=0, pady=(0, 30))
-    
-    def _show_share_return_step(self) -> None:
-        """Show the share return key step."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
+        self.connect_btn = self._action_button(content, "🔗 Connect Now", self._on_connect)
+        self.connect_btn.grid(row=5, column=0, pady=(0, 30))
         
-        # Title
-        title_label = ctk.CTkLabel(
-            self.current_content,
-            text="📤 Share Your Return Key",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=0, column=0, pady=(0, 15))
-        
-        # Instructions
-        instructions_label = ctk.CTkLabel(
-            self.current_content,
-            text="Copy and share this return key with the chat creator.\n"
-                 "They will use it to complete the connection.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
-            justify="center"
-        )
-        instructions_label.grid(row=1, column=0, pady=(0, 20))
+        return content
+    
+    def _build_share_return_step(self) -> ctk.CTkFrame:
+        """Build the share return key step."""
+        content = self._new_step_content(WizardStep.SHARE_RETURN)
         
         # Return key display section with copy button
-        return_section = ctk.CTkFrame(self.current_content, fg_color="transparent")
-        return_section.grid(row=2, column=0, sticky="ew", pady=(15, 10))
-        return_section.grid_columnconfigure(0, weight=1)
-        return_section.grid_columnconfigure(1, weight=0)
-        
-        return_label = ctk.CTkLabel(
-            return_section,
-            text="📤 Your Return Key",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray30", "gray70")
-        )
-        return_label.grid(row=0, column=0, sticky="w")
-        
-        self.copy_return_btn = ctk.CTkButton(
-            return_section,
-            text="📋",
-            width=30,
-            height=30,
-            font=ctk.CTkFont(size=14),
-            corner_radius=6,
-            command=self._copy_return_key,
-            fg_color=("gray45", "gray35"),
-            hover_color=("gray55", "gray25")
-        )
-        self.copy_return_btn.grid(row=0, column=1, sticky="e", padx=(10, 0))
-        
-        self.return_display_text = ctk.CTkTextbox(
-            self.current_content,
-            height=100,
-            font=ctk.CTkFont(size=12, family="monospace"),
-            corner_radius=8,
-            state="disabled"
-        )
-        self.return_display_text.grid(row=3, column=0, sticky="ew", padx=0, pady=(0, 20))
-        
-        # Configure text selection colors
-        self._configure_textbox_selection_colors(self.return_display_text)
+        self._build_key_display(content, "📤 Your Return Key", self._copy_return_key, "copy_return_btn", "return_display_text")
         
         # Waiting message
         waiting_label = ctk.CTkLabel(
-            self.current_content,
+            content,
             text="⏳ Waiting for connection...",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray50", "gray50")
+            font=_get_font(12),
+            text_color=self._C_PLACEHOLDER
         )
         waiting_label.grid(row=5, column=0, pady=(0, 30))
-    
-    def _show_waiting_connection_step(self) -> None:
-        """Show the waiting for connection step."""
-        self.current_content = ctk.CTkFrame(self.wizard_frame, corner_radius=0)
-        self.current_content.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 0))
-        self.current_content.grid_columnconfigure(0, weight=1)
         
-        # Title
-        title_label = ctk.CTkLabel(
-            self.current_content,
-            text="⏳ Establishing Connection",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=0, column=0, pady=(0, 15))
+        return content
+    
+    def _build_waiting_connection_step(self) -> ctk.CTkFrame:
+        """Build the waiting for connection step."""
+        content = self._new_step_content(WizardStep.WAITING_CONNECTION)
         
         # Status message (removed - using main status bar instead)
         status_text = ctk.CTkLabel(
-            self.current_content,
+            content,
             text="Waiting for peer connection...",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray40", "gray60")
+            font=_get_font(14),
+            text_color=self._C_SUB
         )
         status_text.grid(row=1, column=0, pady=(0, 20))
         
         # Progress bar
         self.progress_bar = ctk.CTkProgressBar(
-            self.current_content,
+            content,
             width=300,
             height=20,
             corner_radius=8
@@ -1020,14 +1145,16 @@ class ConnectionWizard:
         
         # Instructions
         instructions_label = ctk.CTkLabel(
-            self.current_content,
+            content,
             text="Please wait while we establish a secure connection.\n"
                  "This may take a few moments depending on your network.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray50", "gray50"),
+            font=_get_font(12),
+            text_color=self._C_PLACEHOLDER,
             justify="center"
         )
         instructions_label.grid(row=3, column=0, pady=(0, 30))
+        
+        return content
     
     def _update_navigation(self) -> None:
         """Update navigation buttons based on current step."""
@@ -1038,18 +1165,13 @@ class ConnectionWizard:
             self.back_btn.grid_remove()
         
         # Update next button text and visibility
-        if self.current_step == WizardStep.WELCOME:
-            self.next_btn.configure(text="Get Started")
-            self.next_btn.grid()
-        elif self.current_step == WizardStep.USERNAME:
-            self.next_btn.configure(text="Continue →")
+        next_text = self._NEXT_BUTTON_TEXT.get(self.current_step)
+        if next_text is None:
+            self.next_btn.grid_remove()
+        else:
+            if self.next_btn.cget("text") != next_text:
+                self.next_btn.configure(text=next_text)
             self.next_btn.grid()
-        elif self.current_step == WizardStep.CONNECTION_TYPE:
-            self.next_btn.grid_remove()  # Hide next button, use individual action buttons
-        elif self.current_step in [WizardStep.CREATE_CHAT, WizardStep.SHARE_INVITE, WizardStep.WAIT_FOR_RETURN, WizardStep.JOIN_CHAT, WizardStep.SHARE_RETURN]:
-            self.next_btn.grid_remove()  # Hide next button, use specific action buttons
-        elif self.current_step == WizardStep.WAITING_CONNECTION:
-            self.next_btn.grid_remove()  # Hide next button during connection
     
     def _go_next(self) -> None:
         """Go to the next step."""
@@ -1064,9 +1186,8 @@ class ConnectionWizard:
         if len(self.step_history) > 1:
             # Remove current step from history
             self.step_history.pop()
-            # Go to previous step
-            previous_step = self.step_history[-1]
-            self._show_step(previous_step)
+            # Go to previous step, which is already on top of the history
+            self._show_step(self.step_history[-1], record=False)
     
     def _select_connection_type(self, connection_type: str) -> None:
         """Select connection type and proceed."""
@@ -1083,67 +1204,101 @@ class ConnectionWizard:
     
     def _save_username(self) -> None:
         """Save the current username."""
-        if hasattr(self, 'username_entry') and self.username_entry and self.username_entry.winfo_exists():
+        if self.username_entry is not None:
             try:
                 username = self.username_entry.get().strip()
                 self.username = username if username else "Anonymous"
-            except Exception as e:
+            except tk.TclError as e:
                 # Widget may have been destroyed, use current username
-                logger.debug(f"Could not get username from entry: {e}")
-                pass
+                logger.debug("Could not get username from entry: %s", e)
     
     def _on_join_with_key(self) -> None:
         """Handle join with key submission."""
-        if hasattr(self, 'join_entry') and self.join_entry and self.join_entry.winfo_exists():
+        if self.join_entry is not None:
             invite_key = self._get_textbox_content(self.join_entry)
             if invite_key and self.on_join_chat:
+                self.join_error_label.grid_remove()
                 self.on_join_chat(invite_key)
             else:
-                messagebox.showwarning("Invalid Input", "Please enter a valid invite key.")
+                self.join_error_label.grid()
         else:
+            from tkinter import messagebox
             messagebox.showerror("Error", "Join input field not found!")
     
     def _on_connect(self) -> None:
         """Handle connect button click."""
-        if hasattr(self, 'return_entry') and self.return_entry and self.return_entry.winfo_exists():
+        if self.return_entry is not None:
             return_key = self._get_textbox_content(self.return_entry)
             if return_key and self.on_connect_chat:
+                self.return_error_label.grid_remove()
                 self.on_connect_chat(return_key)
                 self._show_step(WizardStep.WAITING_CONNECTION)
             else:
-                messagebox.showwarning("Invalid Input", "Please enter a valid return key.")
+                self.return_error_label.grid()
         else:
+            from tkinter import messagebox
             messagebox.showerror("Error", "Return key input field not found!")
     
+    def _set_clipboard(self, text: str) -> None:
+        """Replace the clipboard contents with text."""
+        # Straight to the Tcl clipboard command, skipping the option handling
+        # of clipboard_clear/clipboard_append; "--" keeps keys starting with "-" literal
+        tk_call = self.parent.tk.call
+        tk_call("clipboard", "clear")
+        tk_call("clipboard", "append", "--", text)
+    
     def _copy_invite_key(self) -> None:
         """Copy invite key to clipboard."""
         if self.invite_key:
-            self.parent.clipboard_clear()
-            self.parent.clipboard_append(self.invite_key)
-            # Show temporary feedback by changing button text briefly
-            original_text = self.copy_invite_btn.cget("text")
-            self.copy_invite_btn.configure(text="✅")
-            self.parent.after(1500, lambda: self.copy_invite_btn.configure(text=original_text))
+            self._set_clipboard(self.invite_key)
+            # Show temporary feedback; repeated clicks restart the timer
+            self.copy_invite_btn.configure(text=self.COPIED_ICON)
+            self._schedule("copy_invite", self.COPY_FEEDBACK_MS, self._restore_copy_invite_btn)
+    
+    def _restore_copy_invite_btn(self) -> None:
+        """Put the invite copy button back to its normal icon."""
+        self._after_ids.pop("copy_invite", None)
+        self.copy_invite_btn.configure(text=self.COPY_ICON)
     
     def _copy_return_key(self) -> None:
         """Copy return key to clipboard."""
         if self.return_key:
-            self.parent.clipboard_clear()
-            self.parent.clipboard_append(self.return_key)
-            # Show temporary feedback by changing button text briefly
-            if hasattr(self, 'copy_return_btn'):
-                original_text = self.copy_return_btn.cget("text")
-                self.copy_return_btn.configure(text="✅")
-                self.parent.after(1500, lambda: self.copy_return_btn.configure(text=original_text))
+            self._set_clipboard(self.return_key)
+            # Show temporary feedback; repeated clicks restart the timer
+            if self.copy_return_btn is not None:
+                self.copy_return_btn.configure(text=self.COPIED_ICON)
+                self._schedule("copy_return", self.COPY_FEEDBACK_MS, self._restore_copy_return_btn)
+    
+    def _restore_copy_return_btn(self) -> None:
+        """Put the return copy button back to its normal icon."""
+        self._after_ids.pop("copy_return", None)
+        self.copy_return_btn.configure(text=self.COPY_ICON)
     
     
     def hide(self) -> None:
         """Hide the wizard."""
         # Clear all wizard content from the parent frame
         if self.wizard_frame:
+            # The widgets are about to go away, drop callbacks that would touch them
+            self._cancel_scheduled()
+            self._tooltips.destroy()
+            
             # Clear all children of the wizard frame
             for child in self.wizard_frame.winfo_children():
                 child.destroy()
+            self._step_contents.clear()
+            self._visible_content = None
+            
+            # Forget the destroyed frames and canvas items so show() builds them again
+            self.content_host = None
+            self.navigation_frame = None
+            self.progress_frame = None
+            self.progress_canvas = None
+            self.step_indicators.clear()
+            self._step_items_by_enum.clear()
+            self._indicator_state.clear()
+            self._prev_visible_set = None
+            self._last_indicator_state = None
             # Don't set wizard_frame to None to avoid destroying the parent
             # self.wizard_frame = None
     
@@ -1152,24 +1307,35 @@ class ConnectionWizard:
     def set_invite_key(self, invite_key: str) -> None:
         """Set the invite key and move to share invite step."""
         self.invite_key = invite_key
-        # Move to share invite step
-        self._show_step(WizardStep.SHARE_INVITE)
-        if hasattr(self, 'invite_text') and self.invite_text and self.invite_text.winfo_exists():
-            self.invite_text.configure(state="normal")
-            self.invite_text.delete("0.0", "end")
-            self.invite_text.insert("0.0", invite_key)
-            self.invite_text.configure(state="disabled")
+        with self._batch():
+            # Move to share invite step
+            self._show_step(WizardStep.SHARE_INVITE)
+            if self.invite_text is not None:
+                self.invite_text.delete("0.0", "end")
+                self.invite_text.insert("0.0", invite_key)
     
     def set_return_key(self, return_key: str) -> None:
         """Set the return key and move to share return step."""
         self.return_key = return_key
-        # Move to share return step
-        self._show_step(WizardStep.SHARE_RETURN)
-        if hasattr(self, 'return_display_text') and self.return_display_text and self.return_display_text.winfo_exists():
-            self.return_display_text.configure(state="normal")
-            self.return_display_text.delete("0.0", "end")
-            self.return_display_text.insert("0.0", return_key)
-            self.return_display_text.configure(state="disabled")
+        with self._batch():
+            # Move to share return step
+            self._show_step(WizardStep.SHARE_RETURN)
+            if self.return_display_text is not None:
+                self.return_display_text.delete("0.0", "end")
+                self.return_display_text.insert("0.0", return_key)
+    
+    def reset(self) -> None:
+        """Return the wizard to the welcome step, clearing the keys of the previous chat."""
+        self.step_history.clear()
+        self.connection_type = None
+        self.invite_key = ""
+        self.return_key = ""
+        
+        # The step frames are cached, so clear what the last session left in them
+        with self._batch():
+            for step in self._step_contents:
+                self._reset_step(step)
+            self._show_step(WizardStep.WELCOME)
     
     def set_connection_status(self, status: str, color: str = "gray") -> None:
         """Set the connection status message - now handled by main window status bar."""
@@ -1193,86 +1359,65 @@ class ConnectionWizard:
     
     def _setup_placeholder_text(self, textbox: ctk.CTkTextbox, placeholder: str) -> None:
         """Set up placeholder text for a CTkTextbox that disappears when user types."""
-        # Store placeholder state in a dictionary instead of attributes
-        if not hasattr(self, '_placeholder_states'):
-            self._placeholder_states = {}
+        # Each textbox is wired once; its step content is reused on later visits
+        if hasattr(textbox, '_placeholder_text'):
+            return
         
-        self._placeholder_states[id(textbox)] = {
-            'placeholder_text': placeholder,
-            'is_placeholder': True
-        }
+        # Store the placeholder state on the textbox itself so it dies with it
+        textbox._placeholder_text = placeholder
+        textbox._is_placeholder = True
         
-        textbox.insert("0.0", placeholder)
-        textbox.configure(text_color=("gray50", "gray50"))
+        # Typed text keeps the normal colour; the placeholder is drawn through a
+        # text tag, so swapping it never reconfigures the CTkTextbox itself
+        textbox.configure(text_color=self._C_TEXT)
+        textbox.tag_config("placeholder", foreground="gray50")  # Same in light and dark mode
+        textbox.insert("0.0", placeholder, "placeholder")
         
-        textbox.bind("<Button-1>", lambda e: self._on_textbox_click(textbox))
-        textbox.bind("<KeyPress>", lambda e: self._on_textbox_keypress(textbox, e))
-        textbox.bind("<Control-v>", lambda e: self._on_textbox_paste(textbox, e))
-        textbox.bind("<Shift-Insert>", lambda e: self._on_textbox_paste(textbox, e))
-        textbox.bind("<FocusOut>", lambda e: self._on_textbox_focus_out(textbox))
-    
-    def _on_textbox_click(self, textbox: ctk.CTkTextbox) -> None:
-        """Handle click on textbox with placeholder text."""
-        if self._is_placeholder(textbox):
-            self._clear_placeholder(textbox)
+        # Clicks, typing and pastes all need focus first, so clearing on focus
+        # keeps Python out of the per-keystroke path
+        textbox.bind("<FocusIn>", functools.partial(self._clear_placeholder, textbox))
+        textbox.bind("<FocusOut>", functools.partial(self._on_textbox_focus_out, textbox))
     
-    def _on_textbox_keypress(self, textbox: ctk.CTkTextbox, event) -> None:
-        """Handle key press on textbox with placeholder text."""
-        if self._is_placeholder(textbox):
-            self._clear_placeholder(textbox)
-    
-    def _on_textbox_paste(self, textbox: ctk.CTkTextbox, event) -> None:
-        """Handle paste on textbox with placeholder text."""
-        if self._is_placeholder(textbox):
-            self._clear_placeholder(textbox)
-    
-    def _on_textbox_focus_out(self, textbox: ctk.CTkTextbox) -> None:
+    def _on_textbox_focus_out(self, textbox: ctk.CTkTextbox, event=None) -> None:
         """Handle focus out - restore placeholder if empty."""
-        content = textbox.get("0.0", "end-1c").strip()
-        if not content:
+        # Look for a non-blank character in Tcl rather than copying the whole key out
+        if not textbox.search(r"\S", "1.0", "end-1c", regexp=True):
             self._restore_placeholder(textbox)
     
     def _is_placeholder(self, textbox: ctk.CTkTextbox) -> bool:
         """Check if textbox is showing placeholder text."""
-        if not hasattr(self, '_placeholder_states'):
-            return False
-        state = self._placeholder_states.get(id(textbox))
-        return bool(state and state.get('is_placeholder', False))
+        return getattr(textbox, '_is_placeholder', False)
     
     def _get_placeholder_text(self, textbox: ctk.CTkTextbox) -> str:
         """Get placeholder text for textbox."""
-        if not hasattr(self, '_placeholder_states'):
-            return ""
-        state = self._placeholder_states.get(id(textbox))
-        return state.get('placeholder_text', "") if state else ""
+        return getattr(textbox, '_placeholder_text', "")
     
-    def _clear_placeholder(self, textbox: ctk.CTkTextbox) -> None:
-        """Clear placeholder text and set normal text color."""
+    def _clear_placeholder(self, textbox: ctk.CTkTextbox, event=None) -> None:
+        """Clear placeholder text so typed text shows in the normal color."""
         if self._is_placeholder(textbox):
             textbox.delete("0.0", "end")
-            textbox.configure(text_color=("gray10", "gray90"))
-            if hasattr(self, '_placeholder_states') and id(textbox) in self._placeholder_states:
-                self._placeholder_states[id(textbox)]['is_placeholder'] = False
+            textbox._is_placeholder = False
     
     def _restore_placeholder(self, textbox: ctk.CTkTextbox) -> None:
         """Restore placeholder text if textbox is empty."""
         textbox.delete("0.0", "end")
         placeholder_text = self._get_placeholder_text(textbox)
-        textbox.insert("0.0", placeholder_text)
-        textbox.configure(text_color=("gray50", "gray50"))
-        if hasattr(self, '_placeholder_states') and id(textbox) in self._placeholder_states:
-            self._placeholder_states[id(textbox)]['is_placeholder'] = True
+        textbox.insert("0.0", placeholder_text, "placeholder")
+        textbox._is_placeholder = True
     
-    def _get_textbox_content(self, textbox: ctk.CTkTextbox) -> str:
+    def _get_textbox_content(self, textbox: Optional[ctk.CTkTextbox]) -> str:
         """Get the actual content of textbox, excluding placeholder text."""
-        if not textbox or not textbox.winfo_exists():
+        if textbox is None:
             return ""
         if self._is_placeholder(textbox):
             return ""
         try:
+            # An empty textbox ends at 1.0; only fetch the text when there is some
+            if textbox.index("end-1c") == "1.0":
+                return ""
             return textbox.get("0.0", "end-1c").strip()
-        except Exception as e:
-            logger.debug(f"Could not get textbox content: {e}")
+        except tk.TclError as e:
+            logger.debug("Could not get textbox content: %s", e)
             return ""
     
     def _configure_textbox_selection_colors(self, textbox: ctk.CTkTextbox) -> None:
@@ -1291,95 +1436,3 @@ class ConnectionWizard:
             # Silently fail - this is not critical functionality
             # The text selection color configuration is a nice-to-have feature
             pass
-    
-    def _add_tooltip(self, widget, text: str) -> None:
-        """Add a tooltip to a widget that shows on hover with delay."""
-        def show_tooltip(event):
-            # Don't show tooltip if one already exists
-            if hasattr(widget, '_tooltip') and widget._tooltip:
-                return
-            
-            # Cancel any existing delay safely
-            if hasattr(widget, '_tooltip_delay') and widget._tooltip_delay:
-                try:
-                    widget.after_cancel(widget._tooltip_delay)
-                except ValueError:
-                    # Delay might have already been executed or cancelled
-                    pass
-                widget._tooltip_delay = None
-            
-            # Set a delay before showing tooltip (1.5 seconds)
-            widget._tooltip_delay = widget.after(1500, lambda: _create_tooltip(event))
-        
-        def _create_tooltip(event):
-            # Don't show tooltip if one already exists
-            if hasattr(widget, '_tooltip') and widget._tooltip:
-                return
-                
-            # Create tooltip window
-            tooltip = ctk.CTkToplevel()
-            tooltip.wm_overrideredirect(True)  # Remove window decorations
-            tooltip.wm_attributes("-topmost", True)  # Keep on top
-            
-            # Create tooltip label with better readability
-            tooltip_label = ctk.CTkLabel(
-                tooltip,
-                text=text,
-                font=ctk.CTkFont(size=13, weight="normal"),  # Larger, clearer font
-                text_color=("black", "white"),  # High contrast colors
-                fg_color=("white", "black"),  # High contrast background
-                corner_radius=8,
-                padx=12,  # More padding
-                pady=8,   # More padding
-                wraplength=350  # Allow text wrapping for long messages
-            )
-            tooltip_label.pack()
-            
-            # Position tooltip near mouse cursor but ensure it stays on screen
-            x = event.x_root + 15
-            y = event.y_root + 15
-            
-            # Get screen dimensions to keep tooltip on screen
-            screen_width = tooltip.winfo_screenwidth()
-            screen_height = tooltip.winfo_screenheight()
-            
-            # Adjust position if tooltip would go off screen
-            tooltip.update_idletasks()
-            tooltip_width = tooltip.winfo_reqwidth()
-            tooltip_height = tooltip.winfo_reqheight()
-            
-            if x + tooltip_width > screen_width:
-                x = event.x_root - tooltip_width - 15
-            if y + tooltip_height > screen_height:
-                y = event.y_root - tooltip_height - 15
-                
-            tooltip.geometry(f"+{x}+{y}")
-            
-            # Store tooltip reference for cleanup
-            widget._tooltip = tooltip
-            
-            # Hide tooltip after 10 seconds (even longer for important info)
-            tooltip.after(10000, lambda: hide_tooltip())
-        
-        def hide_tooltip():
-            # Cancel any pending tooltip delay safely
-            if hasattr(widget, '_tooltip_delay') and widget._tooltip_delay:
-                try:
-                    widget.after_cancel(widget._tooltip_delay)
-                except ValueError:
-                    # Delay might have already been executed or cancelled
-                    pass
-                widget._tooltip_delay = None
-            
-            if hasattr(widget, '_tooltip') and widget._tooltip:
-                try:
-                    widget._tooltip.destroy()
-                    widget._tooltip = None
-                except:
-                    pass
-        
-        # Bind events
-        widget.bind("<Enter>", show_tooltip)
-        widget.bind("<Leave>", lambda e: hide_tooltip())
-        widget.bind("<Button-1>", lambda e: hide_tooltip())
-    
@@ -10,13 +10,15 @@ import logging
 import os
 import shutil
 from datetime import datetime
-from typing import Callable, Optional, Dict, Any
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Any
 
 from .file_transfer_dialog import FileTransferDialog
 from .file_progress_dialog import FileProgressDialog
 from .audio_settings_dialog import AudioSettingsDialog
 from .connection_settings_dialog import ConnectionSettingsDialog
-from .connection_wizard import ConnectionWizard
+
+if TYPE_CHECKING:
+    from .connection_wizard import ConnectionWizard
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +92,10 @@ class ModernChatWindow:
         self.local_username = "You"
         
         # Connection wizard
-        self.connection_wizard: Optional[ConnectionWizard] = None
+        self.connection_wizard: Optional["ConnectionWizard"] = None
+        
+        # Connection settings dialog, kept so its window can be reused
+        self.connection_settings_dialog: Optional[ConnectionSettingsDialog] = None
         
         self._setup_ui()
         self._show_connection_wizard()
@@ -335,9 +340,11 @@ class ModernChatWindow:
     def _show_connection_settings(self):
         """Show the connection settings dialog."""
         try:
-            dialog = ConnectionSettingsDialog(self.root, self.current_connection_settings)
-            dialog.on_settings_saved = self._on_connection_settings_saved
-            dialog.show()
+            if self.connection_settings_dialog is None:
+                self.connection_settings_dialog = ConnectionSettingsDialog(self.root, self.current_connection_settings)
+                self.connection_settings_dialog.on_settings_saved = self._on_connection_settings_saved
+            self.connection_settings_dialog.current_settings = self.current_connection_settings
+            self.connection_settings_dialog.show()
         except Exception as e:
             logger.error(f"Failed to show connection settings: {e}")
             messagebox.showerror("Error", f"Failed to open connection settings:\n{e}")
@@ -683,7 +690,9 @@ class ModernChatWindow:
         self.wizard_container.grid_columnconfigure(0, weight=1)
         self.wizard_container.grid_rowconfigure(0, weight=1)
         
-        # Create and show the connection wizard
+        # Create and show the connection wizard; imported here so app startup
+        # does not pay for the wizard module until it is first needed
+        from .connection_wizard import ConnectionWizard
         self.connection_wizard = ConnectionWizard(self.wizard_container)
         
         # Set up wizard callbacks
@@ -1664,15 +1673,8 @@ class ModernChatWindow:
         """Reset the connection wizard to initial state."""
         try:
             if self.connection_wizard:
-                # Reset wizard state
-                self.connection_wizard.current_step = self.connection_wizard.WizardStep.WELCOME
-                self.connection_wizard.step_history.clear()
-                self.connection_wizard.connection_type = None
-                self.connection_wizard.invite_key = ""
-                self.connection_wizard.return_key = ""
-                
-                # Show the welcome step
-                self.connection_wizard._show_step(self.connection_wizard.WizardStep.WELCOME)
+                # Reset wizard state and show the welcome step
+                self.connection_wizard.reset()
                 
                 logger.info("Wizard state reset to initial state")
         except Exception as e:
@@ -23,6 +23,8 @@ MAX_FILE_SIZE = None  # No limit
 MAX_FILENAME_LENGTH = 255
 # Pattern for potentially dangerous characters
 DANGEROUS_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+# Characters not allowed in a (lowercased) STUN hostname
+STUN_HOSTNAME_INVALID_PATTERN = re.compile(r'[^a-z0-9.-]')
 # Allowed file extensions for security
 ALLOWED_FILE_EXTENSIONS: Set[str] = {
     # Documents
@@ -521,7 +523,7 @@ def validate_stun_url(stun_url: str) -> str:
         
         # Validate hostname (basic check for dangerous characters)
         hostname = hostname.lower()
-        if re.search(r'[^a-z0-9.-]', hostname):
+        if STUN_HOSTNAME_INVALID_PATTERN.search(hostname):
             raise SecurityViolation("Invalid characters in STUN hostname")
         
         # Check for localhost/private IPs if desired (optional - users might want local STUN)